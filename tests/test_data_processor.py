@@ -0,0 +1,56 @@
+"""
+Tests for the data processor.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from transient_absorption_analyser.src.core.data_processor import DataProcessor
+from transient_absorption_analyser.src.core.kernels import moving_average_2d
+
+
+@pytest.fixture
+def processor():
+    return DataProcessor()
+
+
+def write_csv(path, wavelengths):
+    frame = pd.DataFrame(
+        np.arange(10 * len(wavelengths), dtype=float).reshape(10, -1),
+        columns=wavelengths
+    )
+    frame.insert(0, "Time", np.arange(10.0))
+    frame.to_csv(path, index=False)
+
+
+def test_wavelengths_follow_column_labels(processor, tmp_path):
+    path = tmp_path / "signal.csv"
+    write_csv(path, ["532.5", "533.0", "534.0"])
+    data = processor._load_data(str(path))
+    np.testing.assert_array_equal(processor._get_wavelengths(data), [532.5, 533.0, 534.0])
+
+    # Relabelled columns of the same count must not reuse the parsed array
+    data.columns = ["Time", "600", "601", "602"]
+    np.testing.assert_array_equal(processor._get_wavelengths(data), [600.0, 601.0, 602.0])
+
+
+def convolve_columns(data, window_size):
+    kernel = np.ones(window_size) / window_size
+    return np.column_stack([
+        np.convolve(column, kernel, mode='same') for column in data.T
+    ])
+
+
+@pytest.mark.parametrize("window_size", [1, 4, 5])
+def test_moving_average_non_finite_matches_convolve(processor, window_size):
+    data = np.linspace(0.0, 1.0, 60).reshape(20, 3)
+    data[3, 0] = np.inf
+    data[10, 1] = -np.inf
+    data[12, 1] = np.inf
+    data[15, 2] = np.nan
+    expected = convolve_columns(data, window_size)
+
+    np.testing.assert_allclose(processor._moving_average(data, window_size), expected)
+    np.testing.assert_allclose(processor._moving_average(data[:, 0], window_size), expected[:, 0])
+    if moving_average_2d is not None:
+        np.testing.assert_allclose(moving_average_2d(data, window_size), expected)
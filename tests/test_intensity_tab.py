@@ -0,0 +1,94 @@
+"""
+Tests for the Intensity tab's time span plots.
+"""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from transient_absorption_analyser.src.core.data_processor import ProcessedData
+from transient_absorption_analyser.src.ui.tabs.intensity_tab import IntensityTab
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def data():
+    """MA data rising with time, so late spans average far above early ones."""
+    times = np.arange(0, 200, 1.0)
+    wavelengths = np.arange(500, 520, 1.0)
+    values = times[:, None] / 100 + np.sin(wavelengths / 3)[None, :] * 0.1
+    frame = pd.DataFrame(values, columns=[str(w) for w in wavelengths])
+    frame.insert(0, "Time", times)
+    return ProcessedData(frame, None, None, None, frame, frame, wavelengths, times, 5)
+
+
+def wait_for_selection(app, tab, timeout=5.0):
+    """Process events until the selection average is plotted in Plot C."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if tab._average_task is None and tab._pending_range is None and tab.plot_c.ax.lines:
+            return
+        time.sleep(0.01)
+    raise TimeoutError("selection average was not plotted")
+
+
+def apply_span(tab, index, min_time, max_time):
+    """Enter and apply a time span in the span entry at index."""
+    while len(tab.time_span_entries) <= index:
+        tab.add_time_span()
+    entry = tab.time_span_entries[index]
+    entry.min_input.setText(str(min_time))
+    entry.max_input.setText(str(max_time))
+    entry.apply_changes()
+
+
+def assert_within_view(ax, x, y):
+    xmin, xmax = sorted(ax.get_xlim())
+    ymin, ymax = sorted(ax.get_ylim())
+    assert xmin <= np.min(x) and np.max(x) <= xmax
+    assert ymin <= np.min(y) and np.max(y) <= ymax
+
+
+def test_span_averages_within_plot_c_after_selection(app, data):
+    tab = IntensityTab()
+    tab.update_data(data)
+
+    # A drag selection over early times sets explicit limits on Plot C
+    tab._on_select(0.0, 20.0)
+    wait_for_selection(app, tab)
+    selection_ylim = tab.plot_c.ax.get_ylim()
+
+    apply_span(tab, 0, 100, 190)
+    apply_span(tab, 1, 150, 199)
+
+    lines = tab.plot_c.ax.lines
+    assert len(lines) == 2
+    for line in lines:
+        assert_within_view(tab.plot_c.ax, line.get_xdata(), line.get_ydata())
+    assert tab.plot_c.ax.get_ylim() != selection_ylim
+
+
+def test_plot_a_time_range_shrinks_when_span_moves_back(app, data):
+    tab = IntensityTab()
+    tab.update_data(data)
+
+    apply_span(tab, 0, 20, 60)
+    initial_xlim = tab.plot_a.ax.get_xlim()
+
+    # A span beyond the data widens the time axis ...
+    apply_span(tab, 0, 20, 400)
+    assert tab.plot_a.ax.get_xlim()[1] > 400
+
+    # ... and moving it back narrows it again
+    apply_span(tab, 0, 20, 60)
+    assert tab.plot_a.ax.get_xlim() == pytest.approx(initial_xlim)
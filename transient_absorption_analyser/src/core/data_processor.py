@@ -1,11 +1,15 @@
 """
 Core data processing functionality for the Transient Absorption Analyser.
 """
-from typing import Dict, List, Optional, Tuple
+import os
+import re
+from typing import Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
 from PySide6.QtCore import QObject, Signal
 
+from transient_absorption_analyser.src.core.kernels import NUMBA_MIN_SIZE, moving_average_2d
+
 class ProcessedData:
     """Container for processed data."""
     
@@ -17,8 +21,8 @@ class ProcessedData:
         dark_common: Optional[pd.DataFrame],
         common_data: pd.DataFrame,
         moving_average_data: pd.DataFrame,  # New parameter for MA data
-        wavelengths: List[float],
-        time_points: List[float],
+        wavelengths: Optional[np.ndarray],
+        time_points: Optional[np.ndarray],
         moving_average_window: int
     ):
         self.signal_data = signal_data
@@ -27,10 +31,97 @@ class ProcessedData:
         self.dark_common = dark_common
         self.common_data = common_data
         self.moving_average_data = moving_average_data  # Store MA data separately
-        self.wavelengths = wavelengths
-        self.time_points = time_points
+        # Given arrays are kept as-is; missing ones are derived on first use
+        if wavelengths is not None:
+            self._wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        if time_points is not None:
+            self._time_points = np.asarray(time_points, dtype=np.float64)
         self.moving_average_window = moving_average_window
         
+    @property
+    def common_data(self) -> pd.DataFrame:
+        """Signal minus reference data (time column first)."""
+        return self._common_data
+        
+    @common_data.setter
+    def common_data(self, data: pd.DataFrame):
+        # Derived arrays are rebuilt lazily from the new frame
+        self._common_data = data
+        self._common_array = None
+        self._wavelengths = None
+        self._time_points = None
+        self._sorted_moving_average = None
+        
+    @property
+    def moving_average_data(self) -> pd.DataFrame:
+        """Moving-average smoothed data (time column first)."""
+        return self._moving_average_data
+        
+    @moving_average_data.setter
+    def moving_average_data(self, data: pd.DataFrame):
+        self._moving_average_data = data
+        self._moving_average_array = None
+        self._sorted_moving_average = None
+        
+    @property
+    def wavelengths(self) -> np.ndarray:
+        """Wavelengths of the common data columns."""
+        if self._wavelengths is None:
+            self._wavelengths = self._common_data.columns[1:].astype(float).to_numpy()
+        return self._wavelengths
+        
+    @property
+    def time_points(self) -> np.ndarray:
+        """Time points of the common data rows."""
+        if self._time_points is None:
+            self._time_points = self._common_data.iloc[:, 0].to_numpy(dtype=np.float64)
+        return self._time_points
+        
+    @property
+    def common_array(self) -> np.ndarray:
+        """Wavelength columns of common_data as a (time, wavelength) array."""
+        if self._common_array is None:
+            self._common_array = self._to_array(self._common_data)
+        return self._common_array
+        
+    @property
+    def moving_average_array(self) -> np.ndarray:
+        """Wavelength columns of moving_average_data as a float32 (time, wavelength) array."""
+        if self._moving_average_array is None:
+            self._moving_average_array = self._to_array(self._moving_average_data, np.float32)
+        return self._moving_average_array
+        
+    @property
+    def sorted_moving_average(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Moving-average data in ascending time and wavelength order.
+        
+        Shared by all tabs; when the data is already in order these are the
+        cached arrays themselves, not copies.
+        
+        Returns:
+            Tuple of (time_points, wavelengths, values), values being a
+            column-major float32 (time, wavelength) array
+        """
+        if self._sorted_moving_average is None:
+            time_order = np.argsort(self.time_points, kind='stable')
+            wave_order = np.argsort(self.wavelengths, kind='stable')
+            values = self.moving_average_array
+            if np.any(np.diff(time_order) != 1) or np.any(np.diff(wave_order) != 1):
+                # Column-major so each wavelength stays one contiguous block
+                values = np.asfortranarray(values[np.ix_(time_order, wave_order)])
+            self._sorted_moving_average = (
+                self.time_points[time_order],
+                self.wavelengths[wave_order],
+                values
+            )
+        return self._sorted_moving_average
+        
+    @staticmethod
+    def _to_array(data: pd.DataFrame, dtype: type = np.float64) -> np.ndarray:
+        """Convert the wavelength columns of a frame to a column-major float array."""
+        return np.asfortranarray(data.iloc[:, 1:].to_numpy(dtype=dtype))
+        
     def get_summary(self) -> str:
         """Get summary of processed data."""
         return (
@@ -48,8 +139,24 @@ class DataProcessor(QObject):
     processing_error = Signal(str)
     processing_progress = Signal(int)  # 0-100%
     
+    # Number of leading bytes inspected when detecting a text file's format
+    SNIFF_BYTES = 64 * 1024
+    DECIMAL_COMMA_PATTERN = re.compile(r'\d,\d')
+    # Translation table turning decimal commas into dots, built once
+    COMMA_TO_DOT = str.maketrans(',', '.')
+    
     def __init__(self):
         super().__init__()
+        # File readers keyed by lower-case file extension
+        self._file_readers = {
+            '.csv': self._read_csv,
+            '.txt': self._read_txt,
+            '.xls': self._read_excel,
+            '.xlsx': self._read_excel,
+        }
+        # Wavelengths parsed at load time, keyed by the wavelength column
+        # labels they were parsed from
+        self._parsed_wavelengths: Dict[Tuple, np.ndarray] = {}
         
     def process_files(
         self,
@@ -70,6 +177,7 @@ class DataProcessor(QObject):
         """
         try:
             # Load data
+            self._parsed_wavelengths.clear()
             self.processing_progress.emit(10)
             signal_data = self._load_data(signal_path)
             reference_data = self._load_data(reference_path) if reference_path else None
@@ -111,7 +219,9 @@ class DataProcessor(QObject):
         """Load data from file."""
         try:
             # Check file extension
-            if not any(file_path.lower().endswith(ext) for ext in ['.csv', '.xls', '.xlsx', '.txt']):
+            extension = os.path.splitext(file_path)[1].lower()
+            reader = self._file_readers.get(extension)
+            if reader is None:
                 raise ValueError(
                     f"Unsupported file format. Please use one of the following:\n"
                     f"- CSV files (.csv)\n"
@@ -121,41 +231,7 @@ class DataProcessor(QObject):
 
             # Load data based on file extension
             try:
-                if file_path.lower().endswith('.csv'):
-                    # Try with different decimal and thousand separators
-                    try:
-                        data = pd.read_csv(file_path, encoding='utf-8', decimal='.', thousands=None)
-                    except:
-                        try:
-                            data = pd.read_csv(file_path, encoding='utf-8', decimal=',', thousands=None)
-                        except:
-                            data = pd.read_csv(file_path, encoding='utf-8')
-                elif file_path.lower().endswith(('.xls', '.xlsx')):
-                    data = pd.read_excel(file_path, engine='openpyxl')
-                elif file_path.lower().endswith('.txt'):
-                    # Try different delimiters and decimal separators
-                    try:
-                        data = pd.read_csv(file_path, delimiter='\t', decimal='.', encoding='utf-8')
-                    except:
-                        try:
-                            data = pd.read_csv(file_path, delimiter='\t', decimal=',', encoding='utf-8')
-                        except:
-                            try:
-                                data = pd.read_csv(file_path, delimiter=',', decimal='.', encoding='utf-8')
-                            except:
-                                try:
-                                    data = pd.read_csv(file_path, delimiter=',', decimal=',', encoding='utf-8')
-                                except:
-                                    data = pd.read_csv(file_path, delimiter=None, encoding='utf-8')
-            except UnicodeDecodeError:
-                # Try different encoding if UTF-8 fails
-                if file_path.lower().endswith('.csv') or file_path.lower().endswith('.txt'):
-                    try:
-                        data = pd.read_csv(file_path, encoding='latin1', decimal='.')
-                    except:
-                        data = pd.read_csv(file_path, encoding='latin1', decimal=',')
-                else:
-                    raise
+                data = reader(file_path)
             except Exception as e:
                 raise ValueError(f"Error reading file: {str(e)}")
 
@@ -172,7 +248,10 @@ class DataProcessor(QObject):
                 )
 
             # Convert any comma-formatted numbers in column names to dots
-            data.columns = [str(col).replace(',', '.') if isinstance(col, str) else col for col in data.columns]
+            if data.columns.inferred_type == 'string':
+                data.columns = data.columns.str.translate(self.COMMA_TO_DOT)
+            else:
+                data.columns = [col.translate(self.COMMA_TO_DOT) if isinstance(col, str) else col for col in data.columns]
 
             # Try to convert column names to float (except first column)
             try:
@@ -180,7 +259,7 @@ class DataProcessor(QObject):
                 for col in data.columns[1:]:
                     try:
                         # Handle both dot and comma decimal separators in column names
-                        col_str = str(col).replace(',', '.')
+                        col_str = str(col).translate(self.COMMA_TO_DOT)
                         wavelengths.append(float(col_str))
                     except ValueError:
                         raise ValueError(
@@ -192,16 +271,23 @@ class DataProcessor(QObject):
                         )
             except Exception as e:
                 raise ValueError(str(e))
+                
+            # Keep the parsed wavelengths so later steps need not re-parse headers
+            self._parsed_wavelengths[tuple(data.columns[1:])] = np.asarray(
+                wavelengths, dtype=np.float64
+            )
 
             # Try to convert all data to numeric, handling both dot and comma decimals
             try:
-                # First column (time)
-                time_col = data.columns[0]
-                data[time_col] = pd.to_numeric(data[time_col].astype(str).str.replace(',', '.'), errors='raise')
-                
-                # Wavelength columns
-                for col in data.columns[1:]:
-                    data[col] = pd.to_numeric(data[col].astype(str).str.replace(',', '.'), errors='raise')
+                # Time and wavelength columns; columns the parser already
+                # read as numbers need no string round-trip
+                for col in data.columns:
+                    if pd.api.types.is_numeric_dtype(data[col]):
+                        continue
+                    data[col] = pd.to_numeric(
+                        data[col].astype(str).str.translate(self.COMMA_TO_DOT),
+                        errors='raise'
+                    )
             except Exception as e:
                 raise ValueError(
                     f"Invalid data values. All values must be numeric.\n"
@@ -229,6 +315,90 @@ class DataProcessor(QObject):
                 f"5. Numbers use either dots (.) or commas (,) as decimal separators"
             )
             
+    def _read_excel(self, file_path: str) -> pd.DataFrame:
+        """Read an Excel workbook."""
+        return pd.read_excel(file_path, engine='openpyxl')
+        
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Read a CSV file."""
+        return self._read_delimited(file_path, ',')
+        
+    def _read_txt(self, file_path: str) -> pd.DataFrame:
+        """Read a text file, tab-delimited unless detected otherwise."""
+        return self._read_delimited(file_path, '\t')
+        
+    def _read_delimited(self, file_path: str, default_delimiter: str) -> pd.DataFrame:
+        """Probe a delimited text file once, then parse it in a single pass."""
+        encoding, delimiter, decimal = self._sniff_text_format(
+            file_path, default_delimiter
+        )
+        try:
+            return pd.read_csv(
+                file_path,
+                sep=delimiter,
+                decimal=decimal,
+                encoding=encoding,
+                engine='c'
+            )
+        except UnicodeDecodeError:
+            # Non UTF-8 bytes beyond the probed sample
+            return pd.read_csv(
+                file_path,
+                sep=delimiter,
+                decimal=decimal,
+                encoding='latin1',
+                engine='c'
+            )
+            
+    def _sniff_text_format(
+        self,
+        file_path: str,
+        default_delimiter: str
+    ) -> Tuple[str, str, str]:
+        """
+        Detect encoding, delimiter and decimal separator of a text data file.
+        
+        Only the first SNIFF_BYTES of the file are read.
+        
+        Returns:
+            Tuple of (encoding, delimiter, decimal separator)
+        """
+        with open(file_path, 'rb') as file:
+            sample = file.read(self.SNIFF_BYTES)
+            
+        try:
+            text = sample.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as e:
+            if e.start >= len(sample) - 3:
+                # A multi-byte character was cut off at the end of the sample
+                text = sample[:e.start].decode('utf-8')
+                encoding = 'utf-8'
+            else:
+                text = sample.decode('latin1')
+                encoding = 'latin1'
+                
+        lines = [line for line in text.splitlines() if line.strip()]
+        if len(sample) == self.SNIFF_BYTES and len(lines) > 1:
+            lines = lines[:-1]  # Last line may be truncated
+            
+        # Prefer delimiters that cannot double as a decimal separator
+        delimiter = default_delimiter
+        for candidate in ('\t', ';', ','):
+            counts = {line.count(candidate) for line in lines}
+            if len(counts) == 1 and 0 not in counts:
+                delimiter = candidate
+                break
+                
+        # Comma decimals are only possible when the delimiter is not a comma
+        decimal = '.'
+        if delimiter != ',' and any(
+            self.DECIMAL_COMMA_PATTERN.search(line) for line in lines[1:]
+        ):
+            decimal = ','
+            
+        return encoding, delimiter, decimal
+        
     def _validate_data(
         self,
         signal_data: pd.DataFrame,
@@ -255,37 +425,38 @@ class DataProcessor(QObject):
             return signal_data, None, None
             
         # Round wavelengths for comparison
-        signal_waves = [round(float(col), 2) for col in signal_data.columns[1:]]
-        ref_waves = [round(float(col), 2) for col in reference_data.columns[1:]]
+        signal_waves = np.round(self._get_wavelengths(signal_data), 2)
+        ref_waves = np.round(self._get_wavelengths(reference_data), 2)
         
-        # Find common wavelengths
-        common_waves = set(signal_waves) & set(ref_waves)
-        if not common_waves:
+        # Find common wavelengths and their column positions in both frames
+        common_waves, sig_idx, ref_idx = np.intersect1d(
+            signal_waves, ref_waves, return_indices=True
+        )
+        if common_waves.size == 0:
             raise ValueError("No common wavelengths found between signal and reference")
+        sig_idx += 1  # Skip time column
+        ref_idx += 1
             
-        # Find common time points
-        common_times = set(signal_data.iloc[:, 0]) & set(reference_data.iloc[:, 0])
-        if not common_times:
+        # Find common time points and the rows holding them in both frames
+        common_times, sig_rows, ref_rows = np.intersect1d(
+            signal_data.iloc[:, 0].to_numpy(),
+            reference_data.iloc[:, 0].to_numpy(),
+            return_indices=True
+        )
+        if common_times.size == 0:
             raise ValueError("No common time points found between signal and reference")
             
-        # Filter data
-        signal_filtered = signal_data[
-            signal_data.iloc[:, 0].isin(common_times)
-        ]
-        reference_filtered = reference_data[
-            reference_data.iloc[:, 0].isin(common_times)
-        ]
+        # Filter data; both frames are now row-aligned on the sorted common times
+        signal_filtered = signal_data.iloc[sig_rows]
+        reference_filtered = reference_data.iloc[ref_rows]
         
-        # Create result DataFrame
+        # Create result DataFrame with all differences assigned at once
+        difference = np.asfortranarray(
+            signal_filtered.iloc[:, sig_idx].to_numpy(dtype=np.float64)
+            - reference_filtered.iloc[:, ref_idx].to_numpy(dtype=np.float64)
+        )
         result = signal_filtered.copy()
-        for wave in common_waves:
-            sig_col = signal_filtered.columns[
-                signal_waves.index(wave) + 1
-            ]
-            ref_col = reference_filtered.columns[
-                ref_waves.index(wave) + 1
-            ]
-            result[sig_col] = signal_filtered[sig_col] - reference_filtered[ref_col]
+        result[list(signal_filtered.columns[sig_idx])] = difference
             
         return result, signal_filtered, reference_filtered
         
@@ -295,15 +466,23 @@ class DataProcessor(QObject):
         window_size: int
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Apply moving average to data and return both raw and processed data."""
-        raw_data = data.copy()
-        ma_data = data.copy()
+        # The raw data is never modified downstream, so share it instead of copying
+        raw_data = data
         
-        # Apply moving average to each wavelength column in ma_data
-        for col in ma_data.columns[1:]:  # Skip time column
-            ma_data[col] = self._moving_average(
-                ma_data[col].values,
-                window_size
-            )
+        # Smooth all wavelength columns (skip time column) in one pass.
+        # Keep the block column-major: pandas stores each column contiguously
+        # and the tabs read whole per-wavelength traces, so no copy or
+        # strided access is needed later.
+        # The smoothed data is only plotted and averaged, so it is stored as
+        # float32 (sums are still accumulated in float64); the raw data used
+        # for export keeps full precision.
+        values = data.iloc[:, 1:].to_numpy(dtype=np.float32)
+        ma_data = pd.DataFrame(
+            self._moving_average(values, window_size).astype(np.float32, order='F'),
+            index=data.index,
+            columns=data.columns[1:]
+        )
+        ma_data.insert(0, data.columns[0], data.iloc[:, 0].to_numpy())
             
         return raw_data, ma_data
         
@@ -312,17 +491,57 @@ class DataProcessor(QObject):
         data: np.ndarray,
         window_size: int
     ) -> np.ndarray:
-        """Calculate moving average."""
-        return np.convolve(
-            data,
-            np.ones(window_size) / window_size,
-            mode='same'
-        )
+        """
+        Calculate moving average along the first axis.
+
+        Accepts a single trace or a 2-D block with one column per wavelength.
+        Uses a running sum so the cost does not depend on the window size.
+        The result matches ``np.convolve(data, ones / window_size, mode='same')``:
+        the window is centred and samples beyond either end count as zero.
+        """
+        if (moving_average_2d is not None and data.ndim == 2
+                and data.size >= NUMBA_MIN_SIZE):
+            return moving_average_2d(data, window_size)
+            
+        n = data.shape[0]
+        samples = data
+        nonfinite_mask = ~np.isfinite(data)
+        has_nonfinite = nonfinite_mask.any()
+        if has_nonfinite:
+            # NaN and +-inf would poison every later running-sum entry, so sum
+            # around them and restore them only for the windows that hold one
+            data = np.where(nonfinite_mask, 0.0, data)
+
+        # Index into the full convolution that 'same' mode keeps for each sample
+        centre = np.arange(n) + (window_size - 1) // 2
+        upper = np.minimum(centre + 1, n)
+        lower = np.maximum(centre - window_size + 1, 0)
+
+        running_sum = np.zeros((n + 1,) + data.shape[1:])
+        np.cumsum(data, axis=0, dtype=np.float64, out=running_sum[1:])
+        result = (running_sum[upper] - running_sum[lower]) / window_size
+
+        if has_nonfinite:
+            # Adding each kind once gives np.convolve's result: +-inf for
+            # infinities of one sign, NaN for NaN or both signs
+            count = np.zeros((n + 1,) + data.shape[1:], dtype=np.intp)
+            for value in (np.inf, -np.inf, np.nan):
+                kind_mask = np.isnan(samples) if np.isnan(value) else samples == value
+                if not kind_mask.any():
+                    continue
+                np.cumsum(kind_mask, axis=0, out=count[1:])
+                with np.errstate(invalid='ignore'):
+                    result[count[upper] > count[lower]] += value
+        return result
         
-    def _get_wavelengths(self, data: pd.DataFrame) -> List[float]:
+    def _get_wavelengths(self, data: pd.DataFrame) -> np.ndarray:
         """Extract wavelengths from data."""
-        return [float(col) for col in data.columns[1:]]
+        # Use the array parsed at load time from these same column labels
+        wavelengths = self._parsed_wavelengths.get(tuple(data.columns[1:]))
+        if wavelengths is not None:
+            return wavelengths
+        return data.columns[1:].astype(float).to_numpy()
         
-    def _get_time_points(self, data: pd.DataFrame) -> List[float]:
+    def _get_time_points(self, data: pd.DataFrame) -> np.ndarray:
         """Extract time points from data."""
-        return data.iloc[:, 0].tolist() 
\ No newline at end of file
+        return data.iloc[:, 0].to_numpy(dtype=np.float64, copy=False)
\ No newline at end of file
@@ -1,29 +1,48 @@
 """
 Export management functionality for the Transient Absorption Analyser.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import hashlib
-import json
-from typing import Dict, Optional, Union
+import os
+import pickle
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from matplotlib.figure import Figure
+from PySide6.QtCore import QObject, QRunnable, Signal
 from transient_absorption_analyser.src.core.data_processor import ProcessedData
 from transient_absorption_analyser.src.ui.plot_widget import PlotWidget
 
 class ExportManager:
     """Manages data and figure exports."""
     
+    # Upper bound on threads saving figures concurrently
+    MAX_SAVE_WORKERS = 4
+    
+    # PNG export settings. Low zlib compression encodes several times faster
+    # for slightly larger files; 'tight' is kept so the outside legends are
+    # not clipped, without touching the on-screen layout.
+    PNG_SAVE_KWARGS = {
+        'dpi': 300,
+        'bbox_inches': 'tight',
+        'metadata': {'Software': None},
+        'pil_kwargs': {'compress_level': 1},
+    }
+    
     def __init__(self):
         self.current_export_dir: Optional[Path] = None
         self.current_data_hash: Optional[str] = None
+        self._last_fingerprint: Optional[tuple] = None
+        self._fingerprint_frames: Dict[str, pd.DataFrame] = {}
         
     def export_all(
         self,
         base_path: str,
         data: Union[ProcessedData, Dict[str, pd.DataFrame]],
-        plots: Dict[str, PlotWidget],
+        plots: Union[Dict[str, PlotWidget], List[Tuple[Figure, str]]],
         moving_average_window: int
     ) -> Path:
         """
@@ -32,7 +51,8 @@ class ExportManager:
         Args:
             base_path: Base directory for export
             data: ProcessedData object or dictionary of data frames to export
-            plots: Dictionary of plot widgets
+            plots: Dictionary of plot widgets, or figures already gathered
+                with collect_figures (required off the GUI thread)
             moving_average_window: Moving average window size
             
         Returns:
@@ -42,8 +62,16 @@ class ExportManager:
             # Convert ProcessedData to dictionary if needed
             data_dict = self._convert_to_dict(data)
             
-            # Calculate new data hash
-            new_hash = self._calculate_data_hash(data_dict)
+            # Calculate new data hash, unless the very same frames were
+            # exported last time
+            fingerprint = self._data_fingerprint(data_dict)
+            if fingerprint == self._last_fingerprint:
+                new_hash = self.current_data_hash
+            else:
+                new_hash = self._calculate_data_hash(data_dict)
+                self._last_fingerprint = fingerprint
+                # Keep the frames alive so their ids cannot be reused
+                self._fingerprint_frames = dict(data_dict)
             
             # Create new export directory if needed
             if (self.current_export_dir is None or 
@@ -64,6 +92,8 @@ class ExportManager:
                 self._export_data_files(data_dict)
             
             # Always export figures
+            if isinstance(plots, dict):
+                plots = self.collect_figures(plots)
             self._export_figures(plots)
             
             return self.current_export_dir
@@ -95,14 +125,29 @@ class ExportManager:
         # Ensure base_path is a proper Path object and resolve it
         return Path(base_path).resolve() / dir_name
         
+    def _data_fingerprint(self, data_dict: Dict[str, pd.DataFrame]) -> tuple:
+        """Cheap identity/shape fingerprint used to skip re-hashing."""
+        return tuple(
+            (key, id(df), df.shape) if df is not None else (key, None, None)
+            for key, df in data_dict.items()
+        )
+        
     def _calculate_data_hash(self, data_dict: Dict[str, pd.DataFrame]) -> str:
         """Calculate hash of data to detect changes."""
-        # Convert numerical data to string with fixed precision
-        data_str = json.dumps({
-            key: df.round(10).to_json() if df is not None else None
-            for key, df in data_dict.items()
-        })
-        return hashlib.md5(data_str.encode()).hexdigest()
+        # Hash the raw value buffers instead of a text serialisation
+        hasher = hashlib.blake2b(digest_size=16)
+        for key, df in data_dict.items():
+            hasher.update(key.encode())
+            if df is None:
+                hasher.update(b'\x00')
+                continue
+            values = df.to_numpy()
+            hasher.update(str((values.shape, values.dtype.str, list(df.columns))).encode())
+            if values.dtype == object:
+                hasher.update(df.to_json().encode())
+            else:
+                hasher.update(np.ascontiguousarray(values))
+        return hasher.hexdigest()
         
     def _export_data_files(self, data_dict: Dict[str, pd.DataFrame]):
         """Export data files if they don't exist."""
@@ -130,46 +175,125 @@ class ExportManager:
             print(f"Error in _export_data_files: {str(e)}")
             raise
                     
-    def _export_figures(self, plots: Dict[str, PlotWidget]):
-        """Export figures with timestamp for uniqueness."""
+    def collect_figures(
+        self,
+        plots: Dict[str, PlotWidget]
+    ) -> List[Tuple[Figure, str]]:
+        """
+        Snapshot plot figures and name them with a timestamp for uniqueness.
+        
+        Must run on the GUI thread; the returned figures are off-screen
+        copies that can be saved from any thread.
+        
+        Returns:
+            List of (figure, base file name) pairs
+        """
+        timestamp = datetime.now().strftime('%H%M%S')
+        figures = []
+        for plot_name, plot_widget in plots.items():
+            if plot_widget is None:
+                continue
+            
+            # Get an off-screen copy of the widget's figure
+            fig = plot_widget.snapshot()
+            
+            # Generate base name based on plot type
+            if plot_name == 'plot_A':  # Add condition for Plot A from Spectrum tab
+                base_name = f"all_wavelengths_{timestamp}"
+            elif plot_name == 'plot_B' and hasattr(plot_widget, 'highlighted_wavelength'):
+                base_name = f"curve_{plot_widget.highlighted_wavelength}_{timestamp}"
+            elif plot_name == 'plot_C' and hasattr(plot_widget, 'time_range') and plot_widget.time_range is not None:
+                base_name = (
+                    f"avg_signal_vs_wavelength_time_"
+                    f"{int(plot_widget.time_range[0])}_{int(plot_widget.time_range[1])}ns_{timestamp}"
+                )
+            elif plot_name == 'plot_A_intensity':  # Plot A from Intensity tab
+                base_name = f"time_range_selection_{timestamp}"
+            else:
+                base_name = f"all_spectrum_{timestamp}"
+                
+            figures.append((fig, base_name))
+        return figures
+        
+    def _export_figures(self, figures: List[Tuple[Figure, str]]):
+        """Export collected figures into the current export directory."""
         try:
             fig_dir = Path(self.current_export_dir) / 'figures'
             fig_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime('%H%M%S')
-            
-            for plot_name, plot_widget in plots.items():
-                if plot_widget is None:
-                    continue
-                
-                # Get the matplotlib figure from the widget
-                fig = plot_widget.figure
                 
-                # Generate base name based on plot type
-                if plot_name == 'plot_A':  # Add condition for Plot A from Spectrum tab
-                    base_name = f"all_wavelengths_{timestamp}"
-                elif plot_name == 'plot_B' and hasattr(plot_widget, 'highlighted_wavelength'):
-                    base_name = f"curve_{plot_widget.highlighted_wavelength}_{timestamp}"
-                elif plot_name == 'plot_C' and hasattr(plot_widget, 'time_range') and plot_widget.time_range is not None:
-                    base_name = (
-                        f"avg_signal_vs_wavelength_time_"
-                        f"{int(plot_widget.time_range[0])}_{int(plot_widget.time_range[1])}ns_{timestamp}"
-                    )
-                elif plot_name == 'plot_A_intensity':  # Plot A from Intensity tab
-                    base_name = f"time_range_selection_{timestamp}"
-                else:
-                    base_name = f"all_spectrum_{timestamp}"
+            if not figures:
+                return
                 
-                # Save in PNG format
-                png_path = fig_dir / f"{base_name}.png"
-                print(f"Saving PNG to: {png_path}")
-                fig.savefig(png_path, dpi=300, bbox_inches='tight')
-                
-                # Save in pickle format for editability
-                pickle_path = fig_dir / f"{base_name}.pkl"
-                print(f"Saving editable figure to: {pickle_path}")
-                import pickle
-                with open(pickle_path, 'wb') as file:
-                    pickle.dump(fig, file)
+            # Each snapshot is independent and Agg rendering / PNG encoding
+            # release the GIL, so save them concurrently; more threads than
+            # cores would only contend
+            workers = min(self.MAX_SAVE_WORKERS, len(figures), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._save_figure, fig, fig_dir, base_name)
+                    for fig, base_name in figures
+                ]
+                for future in futures:
+                    future.result()
         except Exception as e:
             print(f"Error in _export_figures: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+            
+    def _save_figure(self, fig: Figure, fig_dir: Path, base_name: str):
+        """Save a single figure as PNG and as an editable pickle."""
+        # Save in PNG format
+        png_path = fig_dir / f"{base_name}.png"
+        print(f"Saving PNG to: {png_path}")
+        # Snapshots carry their own Agg canvas; print through it directly
+        fig.canvas.print_figure(png_path, format='png', **self.PNG_SAVE_KWARGS)
+        
+        # Save in pickle format for editability
+        pickle_path = fig_dir / f"{base_name}.pkl"
+        print(f"Saving editable figure to: {pickle_path}")
+        with open(pickle_path, 'wb') as file:
+            pickle.dump(fig, file)
+
+
+class ExportSignals(QObject):
+    """Signals emitted by an ExportTask."""
+    
+    finished = Signal(object)  # Emits export directory Path
+    error = Signal(str)
+
+
+class ExportTask(QRunnable):
+    """Runs ExportManager.export_all on a thread pool thread."""
+    
+    def __init__(
+        self,
+        export_manager: ExportManager,
+        base_path: str,
+        data: Union[ProcessedData, Dict[str, pd.DataFrame]],
+        plots: Dict[str, PlotWidget],
+        moving_average_window: int
+    ):
+        super().__init__()
+        self.signals = ExportSignals()
+        self.export_manager = export_manager
+        self.base_path = base_path
+        self.data = data
+        # Figures are snapshotted here, on the GUI thread
+        self.figures = export_manager.collect_figures(plots)
+        self.moving_average_window = moving_average_window
+        
+    def run(self):
+        """Export data and figures."""
+        try:
+            export_dir = self.export_manager.export_all(
+                self.base_path,
+                self.data,
+                self.figures,
+                self.moving_average_window
+            )
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(export_dir)
+        finally:
+            # The snapshots hold full copies of every plotted trace
+            self.figures = None
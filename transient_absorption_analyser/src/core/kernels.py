@@ -0,0 +1,105 @@
+"""
+Optional Numba-compiled kernels for the Transient Absorption Analyser.
+
+Numba is not a required dependency. When it is missing every kernel here
+is None and callers use their NumPy implementation instead.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# Blocks with fewer values than this are faster with NumPy; below it the
+# thread start-up of the parallel kernels outweighs the work
+NUMBA_MIN_SIZE = 2_000_000
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _nonfinite_kind(value: float) -> int:
+        """Index of a non-finite value in moving_average_2d's counts."""
+        if np.isnan(value):
+            return 2
+        return 0 if value > 0 else 1
+        
+    @numba.njit(parallel=True, cache=True)
+    def moving_average_2d(data: np.ndarray, window_size: int) -> np.ndarray:
+        """
+        Centred moving average down each column of a (time, wavelength) block.
+
+        Matches ``np.convolve(column, ones / window_size, mode='same')``:
+        samples beyond either end count as zero, a window holding infinities
+        of one sign gives that infinity and one holding NaN or both signs
+        gives NaN. Columns are processed in parallel, each with a running sum
+        of the finite samples kept in float64.
+        """
+        n, m = data.shape
+        out = np.empty((n, m), dtype=np.float64)
+        before = window_size // 2
+        after = (window_size - 1) // 2
+        for j in numba.prange(m):
+            total = 0.0
+            # Non-finite samples in the window: +inf, -inf and NaN
+            counts = np.zeros(3, dtype=np.int64)
+            # Prime the window for output 0: samples [0, after]
+            for k in range(min(after + 1, n)):
+                value = data[k, j]
+                if np.isfinite(value):
+                    total += value
+                else:
+                    counts[_nonfinite_kind(value)] += 1
+            for i in range(n):
+                mean = total / window_size
+                if counts[0]:
+                    mean += np.inf
+                if counts[1]:
+                    mean -= np.inf
+                if counts[2]:
+                    mean = np.nan
+                out[i, j] = mean
+                # Slide to i + 1: add sample i + 1 + after, drop i - before
+                entering = i + 1 + after
+                if entering < n:
+                    value = data[entering, j]
+                    if np.isfinite(value):
+                        total += value
+                    else:
+                        counts[_nonfinite_kind(value)] += 1
+                leaving = i - before
+                if leaving >= 0:
+                    value = data[leaving, j]
+                    if np.isfinite(value):
+                        total -= value
+                    else:
+                        counts[_nonfinite_kind(value)] -= 1
+        return out
+        
+    # Only reassociation is relaxed, so the column sums can be vectorised;
+    # full fastmath would let LLVM assume there are no NaNs
+    @numba.njit(parallel=True, cache=True, fastmath={'reassoc', 'contract'})
+    def column_means(data: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """
+        Mean of rows [start, stop) of each column of a (time, wavelength) block.
+        
+        Matches ``data[start:stop].mean(axis=0)`` accumulated in float64,
+        including NaN for any column with a NaN in range. Columns are
+        processed in parallel without a temporary copy of the block; sums
+        may differ from NumPy's in the last bits.
+        """
+        m = data.shape[1]
+        count = stop - start
+        out = np.empty(m, dtype=np.float64)
+        for j in numba.prange(m):
+            total = 0.0
+            for i in range(start, stop):
+                total += data[i, j]
+            out[j] = total / count if count > 0 else np.nan
+        return out
+        
+else:
+    moving_average_2d = None
+    column_means = None
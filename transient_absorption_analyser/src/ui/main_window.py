@@ -2,6 +2,7 @@
 Main window implementation for the Transient Absorption Analyser.
 """
 from pathlib import Path
+from typing import Optional
 from PySide6.QtWidgets import (
     QMainWindow, 
     QTabWidget,
@@ -13,20 +14,37 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QThreadPool
 from PySide6.QtGui import QPixmap
 
 from .tabs.load_tab import LoadTab
 from .tabs.spectrum_tab import SpectrumTab
 from .tabs.intensity_tab import IntensityTab
-from transient_absorption_analyser.src.core.export_manager import ExportManager
+from transient_absorption_analyser.src.core.export_manager import ExportManager, ExportTask
 
 class MainWindow(QMainWindow):
     """Main window of the application."""
     
+    # Title image scaled once per process and shared by all windows
+    _TITLE_PIXMAP: Optional[QPixmap] = None
+    
+    EXPORT_BUTTON_STYLE = (
+        "QPushButton {"
+        "   background-color: #4CAF50;"
+        "   color: white;"
+        "   padding: 8px 16px;"  # Increased horizontal padding
+        "   border-radius: 4px;"
+        "   min-width: 80px;"  # Set minimum width
+        "}"
+        "QPushButton:hover {"
+        "   background-color: #45a049;"
+        "}"
+    )
+    
     def __init__(self):
         super().__init__()
         self.export_manager = ExportManager()
+        self._export_task: Optional[ExportTask] = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -52,11 +70,14 @@ class MainWindow(QMainWindow):
         # Add title image
         title_label = QLabel()
         title_path = Path(__file__).parent.parent.parent / 'resources' / 'app_title.png'
-        if title_path.exists():
-            pixmap = QPixmap(str(title_path))
-            # Scale to a reasonable height while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaledToHeight(80, Qt.SmoothTransformation)
-            title_label.setPixmap(scaled_pixmap)
+        if MainWindow._TITLE_PIXMAP is None and title_path.exists():
+            # Scale to a reasonable height while maintaining aspect ratio;
+            # the unscaled image is not kept
+            MainWindow._TITLE_PIXMAP = QPixmap(str(title_path)).scaledToHeight(
+                80, Qt.SmoothTransformation
+            )
+        if MainWindow._TITLE_PIXMAP is not None:
+            title_label.setPixmap(MainWindow._TITLE_PIXMAP)
             title_label.setAlignment(Qt.AlignCenter)
         top_layout.addWidget(title_label)
         
@@ -65,18 +86,7 @@ class MainWindow(QMainWindow):
         
         # Create export button
         self.export_button = QPushButton("Export")
-        self.export_button.setStyleSheet(
-            "QPushButton {"
-            "   background-color: #4CAF50;"
-            "   color: white;"
-            "   padding: 8px 16px;"  # Increased horizontal padding
-            "   border-radius: 4px;"
-            "   min-width: 80px;"  # Set minimum width
-            "}"
-            "QPushButton:hover {"
-            "   background-color: #45a049;"
-            "}"
-        )
+        self.export_button.setStyleSheet(self.EXPORT_BUTTON_STYLE)
         self.export_button.clicked.connect(self.handle_export)
         top_layout.addWidget(self.export_button)
         
@@ -126,27 +136,47 @@ class MainWindow(QMainWindow):
                 )
                 return
                 
-            # Export data and plots
-            export_dir = self.export_manager.export_all(
+            # Export data and plots on a worker thread; the button stays
+            # disabled until the export reports back
+            task = ExportTask(
+                self.export_manager,
                 export_path,
                 data,  # Pass ProcessedData object directly
                 self.get_current_plots(),
                 self.load_tab.get_moving_average_window()
             )
-            
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Export Complete",
-                f"Data and figures exported to:\n{export_dir}"
-            )
+            task.signals.finished.connect(self.on_export_finished)
+            task.signals.error.connect(self.on_export_error)
+            self._export_task = task  # Keep the task and its signals alive
+            self.export_button.setEnabled(False)
+            QThreadPool.globalInstance().start(task)
             
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Error during export: {str(e)}"
-            )
+            self.on_export_error(str(e))
+            
+    @Slot(object)
+    def on_export_finished(self, export_dir):
+        """Handle successful completion of a background export."""
+        self._export_task = None
+        self.export_button.setEnabled(True)
+        
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Export Complete",
+            f"Data and figures exported to:\n{export_dir}"
+        )
+        
+    @Slot(str)
+    def on_export_error(self, error_msg: str):
+        """Handle a failed export."""
+        self._export_task = None
+        self.export_button.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Error during export: {error_msg}"
+        )
             
     def get_current_plots(self):
         """Get current plot objects from tabs."""
@@ -1,19 +1,32 @@
 """
 Custom plot widget combining Qt and Matplotlib functionality.
 """
-from typing import Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List, Union
+import pickle
 import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QCheckBox, QSizePolicy
+import matplotlib
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg,
     NavigationToolbar2QT
 )
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 
 class PlotWidget(QWidget):
     """Widget for displaying interactive matplotlib plots."""
     
+    # Antialiasing of the bulk per-wavelength traces on screen. Agg spends a
+    # large share of each redraw antialiasing dozens to hundreds of lines, so
+    # it is off interactively; exported snapshots turn it back on.
+    BULK_LINE_ANTIALIASED = False
+    
+    # Highlight colors, cycled in selection order
+    HIGHLIGHT_COLORS = matplotlib.colormaps['tab10'](np.arange(10))
+    
     def __init__(
         self,
         title: str = "",
@@ -26,6 +39,29 @@ class PlotWidget(QWidget):
         self.highlighted_wavelength = None
         self.time_range = None
         
+        # Artists reused across redraws of the same kind of plot: one line
+        # per wavelength for 'all', one grey collection for 'highlighted' and
+        # the spectrum line for 'average'
+        self._lines: Dict[float, Line2D] = {}
+        self._grey_lines: Optional[LineCollection] = None
+        self._average_line: Optional[Line2D] = None
+        self._line_kind: Optional[str] = None
+        # Trace artists on the axes with the matrix rows they show, so their
+        # decimated data can be refreshed when the x-range changes
+        self._trace_rows: List[Tuple[Union[Line2D, LineCollection], np.ndarray]] = []
+        self._xlim_callbacks = None
+        
+        # Traces to plot: one matrix row per wavelength, see ingest()
+        self._wavelengths = np.empty(0)
+        self._times = np.empty(0)
+        self._matrix = np.empty((0, 0))
+        self._row_index: Dict[float, int] = {}
+        self._times_sorted = True
+        self._time_range: Optional[Tuple[float, float]] = None
+        self._value_range: Optional[Tuple[float, float]] = None
+        # Full-range display traces with the canvas width they were made for
+        self._display_cache: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+        
         # Create the main layout first
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -41,6 +77,8 @@ class PlotWidget(QWidget):
             QSizePolicy.Expanding,
             QSizePolicy.Expanding
         )
+        # Traces are decimated to the canvas width, so redo it on resize
+        self.canvas.mpl_connect('resize_event', self._on_resize)
         
         # Add widgets to layout
         if self.sync_zoom:
@@ -71,68 +109,339 @@ class PlotWidget(QWidget):
             self.ax.set_title(self.title, pad=8)  # Reduced padding (was 15)
         self.ax.grid(True)
         
+    def _set_margins(self, **margins: float):
+        """Apply subplot margins unless they are already in effect."""
+        # subplots_adjust repositions the axes and all their children
+        params = self.figure.subplotpars
+        if any(getattr(params, name) != value for name, value in margins.items()):
+            self.figure.subplots_adjust(**margins)
+            
+    def ingest(
+        self,
+        wavelengths: np.ndarray,
+        times: np.ndarray,
+        matrix: np.ndarray
+    ):
+        """
+        Store the wavelength traces used by the trace plots.
+        
+        Trace values are kept as contiguous float32, which is ample for
+        screen and export resolution and halves what Agg has to read.
+        
+        Args:
+            wavelengths: Wavelength of each trace
+            times: Time points shared by all traces
+            matrix: Trace values, shape (n_wavelengths, n_time)
+        """
+        self._wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        # Matrix row of each wavelength, for highlight lookups
+        self._row_index = {wave: index for index, wave in enumerate(self._wavelengths.tolist())}
+        self._times = np.asarray(times, dtype=np.float64)
+        # Moving-average data is float32 already and passes without a copy
+        self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        # Decimation bins consecutive samples, which needs ascending times
+        self._times_sorted = bool(np.all(np.diff(self._times) >= 0))
+        self._time_range = None
+        self._value_range = None
+        self._display_cache = None
+        
+    def _get_time_range(self) -> Tuple[float, float]:
+        """Earliest and latest time of the ingested traces, cached per ingest."""
+        if self._time_range is None:
+            times = self._times
+            if self._times_sorted:
+                self._time_range = (float(times[0]), float(times[-1]))
+            else:
+                self._time_range = (float(times.min()), float(times.max()))
+        return self._time_range
+        
+    def has_traces(self) -> bool:
+        """Check if wavelength traces have been ingested."""
+        return self._matrix.size > 0
+        
+    def _ingest_dict(self, time_points: List[float], data: Optional[dict]):
+        """Ingest traces given as a {wavelength: values} dictionary."""
+        if data is not None:
+            self.ingest(list(data), time_points, np.vstack(list(data.values())))
+            
+    @staticmethod
+    def _decimate(
+        times: np.ndarray,
+        matrix: np.ndarray,
+        n_pixels: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce traces to at most 2 * n_pixels points for display.
+        
+        Samples are grouped into at most n_pixels bins. Each bin contributes
+        its minimum and maximum in time order, placed at the bin's first and
+        last time, so the drawn envelope matches the full trace.
+        """
+        n_time = times.size
+        if n_time <= 2 * n_pixels:
+            return times, matrix
+            
+        bin_size = -(-n_time // n_pixels)
+        n_bins = -(-n_time // bin_size)
+        padding = n_bins * bin_size - n_time
+        if padding:
+            times = np.pad(times, (0, padding), mode='edge')
+            matrix = np.pad(matrix, ((0, 0), (0, padding)), mode='edge')
+            
+        bins = matrix.reshape(matrix.shape[0], n_bins, bin_size)
+        low, high = bins.min(axis=2), bins.max(axis=2)
+        min_first = bins.argmin(axis=2) <= bins.argmax(axis=2)
+        values = np.empty((matrix.shape[0], n_bins, 2), dtype=matrix.dtype)
+        values[..., 0] = np.where(min_first, low, high)
+        values[..., 1] = np.where(min_first, high, low)
+        
+        time_bins = times.reshape(n_bins, bin_size)
+        bin_times = np.column_stack([time_bins[:, 0], time_bins[:, -1]])
+        return bin_times.ravel(), values.reshape(matrix.shape[0], 2 * n_bins)
+        
+    def _display_traces(self, in_view: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the ingested traces decimated to the canvas width.
+        
+        Args:
+            in_view: Only decimate the samples inside the current x-range
+                (plus one on each side), instead of the whole trace
+        """
+        times, matrix = self._times, self._matrix
+        if not self._times_sorted or times.size == 0:
+            return times, matrix
+            
+        # get_width_height() is in logical pixels; HiDPI screens draw
+        # device_pixel_ratio physical pixels for each
+        width = self.canvas.get_width_height()[0] * self.canvas.device_pixel_ratio
+        n_pixels = max(int(round(width)), 1)
+        if in_view:
+            xmin, xmax = sorted(self.ax.get_xlim())
+            start = max(np.searchsorted(times, xmin) - 1, 0)
+            stop = np.searchsorted(times, xmax, side='right') + 1
+            return self._decimate(times[start:stop], matrix[:, start:stop], n_pixels)
+            
+        # The full-range traces are redrawn on every plot call; decimate them
+        # once per ingest and canvas width
+        if self._display_cache is None or self._display_cache[0] != n_pixels:
+            self._display_cache = (n_pixels,) + self._decimate(times, matrix, n_pixels)
+        return self._display_cache[1:]
+        
+    @staticmethod
+    def _segments(times: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Build (n_traces, n_time, 2) LineCollection segments."""
+        segments = np.empty(values.shape + (2,))
+        segments[..., 0] = times
+        segments[..., 1] = values
+        return segments
+        
+    def _refresh_traces(self, decimate: bool = True):
+        """Reset the data of the trace artists for the current x-range."""
+        if decimate:
+            times, matrix = self._display_traces(in_view=True)
+        else:
+            times, matrix = self._times, self._matrix
+        self._set_trace_data(times, matrix)
+        
+    def _set_trace_data(self, times: np.ndarray, matrix: np.ndarray):
+        """Give every trace artist on the axes its rows of matrix."""
+        for artist, rows in self._trace_rows:
+            if artist.axes is not self.ax:
+                continue
+            if isinstance(artist, LineCollection):
+                artist.set_segments(self._segments(times, matrix[rows]))
+            else:
+                artist.set_data(times, matrix[rows])
+                
+    def _on_xlim_changed(self, ax):
+        """Re-decimate the traces for the new x-range."""
+        self._refresh_traces()
+        
+    def _on_resize(self, event):
+        """Re-decimate the traces for the new canvas width."""
+        self._refresh_traces()
+        
+    def _connect_xlim_callback(self):
+        """Connect _on_xlim_changed, again after the axes were cleared."""
+        # Axes.clear() replaces the callback registry
+        if self._xlim_callbacks is not self.ax.callbacks:
+            self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+            self._xlim_callbacks = self.ax.callbacks
+            
+    def add_trace_collection(self, **kwargs) -> LineCollection:
+        """
+        Draw every ingested trace as a single LineCollection.
+        
+        The traces are decimated to the canvas width and follow zooming like
+        the other trace plots.
+        
+        Args:
+            **kwargs: Passed on to LineCollection (colors, alpha, ...)
+            
+        Returns:
+            The added collection
+        """
+        times, matrix = self._display_traces()
+        collection = LineCollection(self._segments(times, matrix), **kwargs)
+        self.ax.add_collection(collection)
+        
+        # Drop artists of an axes cleared elsewhere
+        self._trace_rows = [
+            (artist, rows) for artist, rows in self._trace_rows
+            if artist.axes is self.ax
+        ]
+        self._trace_rows.append((collection, np.arange(len(self._wavelengths))))
+        self._connect_xlim_callback()
+        return collection
+        
+    def autoscale(self):
+        """
+        Fit the view to the visible plotted data, growing or shrinking it.
+        
+        Trace artists are first reset to their full time range, as zooming
+        decimates them to the samples of the previous view only.
+        """
+        if self._trace_rows:
+            self._set_trace_data(*self._display_traces())
+        self.ax.relim(visible_only=True)
+        self.ax.set_autoscale_on(True)
+        self.ax.autoscale_view()
+        
+    def remove_artists(self, keep: Iterable[Artist] = ()):
+        """
+        Remove the plotted artists and the legend, but keep the axes setup.
+        
+        Cheaper than Axes.clear() when the labels, ticks and limits stay.
+        
+        Args:
+            keep: Artists to leave on the axes
+        """
+        keep = set(keep)
+        for artists in (self.ax.lines, self.ax.collections, self.ax.patches, self.ax.texts):
+            for artist in list(artists):
+                if artist not in keep:
+                    artist.remove()
+        if self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+            
+    def _prepare_trace_lines(self, kind: str) -> bool:
+        """
+        Clear the axes for a new set of wavelength traces ('all',
+        'highlighted') or a new average spectrum ('average').
+        
+        When the cached artists were drawn by the same kind of plot, only the
+        other artists are removed and the cached ones are kept for in-place
+        updates. Otherwise the axes are fully cleared and the cache is reset.
+        
+        Returns:
+            True if the cached artists can be reused
+        """
+        if kind == 'all':
+            cached = list(self._lines.values())
+        elif kind == 'highlighted':
+            cached = [self._grey_lines] if self._grey_lines is not None else []
+        else:
+            cached = [self._average_line] if self._average_line is not None else []
+        reusable = (
+            bool(cached)
+            and self._line_kind == kind
+            and all(artist.axes is self.ax for artist in cached)
+        )
+        if reusable:
+            self.remove_artists(keep=cached)
+            self.ax.set_title("")
+        else:
+            self.ax.clear()
+            self._lines = {}
+            self._grey_lines = None
+            self._average_line = None
+            self._line_kind = kind
+        self._trace_rows = []
+        return reusable
+        
     def plot_all_wavelengths(
         self,
-        time_points: List[float],
-        data: dict,
+        time_points: Optional[List[float]] = None,
+        data: Optional[dict] = None,
         clear: bool = True,
         respect_limits: bool = False
     ):
-        """Plot all wavelengths vs time."""
+        """
+        Plot all wavelengths vs time.
+        
+        Plots the ingested traces, or ingests time_points and a
+        {wavelength: values} data dictionary first when given.
+        """
+        self._ingest_dict(time_points, data)
+        times, matrix = self._display_traces()
+        
+        reuse_lines = False
         if clear:
             # Store current limits if needed
             if respect_limits:
                 curr_xlim = self.ax.get_xlim()
                 curr_ylim = self.ax.get_ylim()
-            self.ax.clear()
+            reuse_lines = self._prepare_trace_lines('all')
             if respect_limits:
                 self.ax.set_xlim(curr_xlim)
                 self.ax.set_ylim(curr_ylim)
+        self._connect_xlim_callback()
             
-        # Debug info
-        print(f"Plotting {len(data)} wavelengths")
-        print(f"Time points range: {min(time_points)} to {max(time_points)}")
-        
-        # Plot each wavelength and collect all values for scale calculation
-        all_values = []
-        for wavelength, values in data.items():
-            self.ax.plot(
-                time_points,
-                values,
-                label=f"{wavelength} nm"
+        # Plot each wavelength: update the cached lines of wavelengths still
+        # present, remove the others and create lines for new wavelengths
+        wavelengths = self._wavelengths.tolist()
+        lines = dict(self._lines) if reuse_lines else {}
+        for wavelength in [w for w in lines if w not in self._row_index]:
+            lines.pop(wavelength).remove()
+        for wavelength, line in lines.items():
+            line.set_data(times, matrix[self._row_index[wavelength]])
+            
+        new_rows = [row for row, wavelength in enumerate(wavelengths) if wavelength not in lines]
+        if new_rows:
+            # One call draws every new row of the matrix as its own line
+            new_lines = self.ax.plot(
+                times,
+                (matrix if len(new_rows) == len(wavelengths) else matrix[new_rows]).T,
+                label=[f"{wavelengths[row]} nm" for row in new_rows],
+                antialiased=self.BULK_LINE_ANTIALIASED
             )
-            all_values.extend(values)
+            lines.update((wavelengths[row], line) for row, line in zip(new_rows, new_lines))
             
+        lines = [lines[wavelength] for wavelength in wavelengths]
+        if clear:
+            self._lines = dict(zip(wavelengths, lines))
+        self._trace_rows.extend(zip(lines, range(len(lines))))
+                
         # Only set limits if not respecting external limits
         if not respect_limits:
-            # Calculate proper axis limits using min/max
-            all_values = np.array(all_values)
-            y_min = np.min(all_values)
-            y_max = np.max(all_values)
+            # Calculate proper axis limits using min/max, once per ingest
+            if self._value_range is None:
+                self._value_range = (
+                    float(np.nanmin(self._matrix)),
+                    float(np.nanmax(self._matrix))
+                )
+            y_min, y_max = self._value_range
             
             # Add padding proportional to the range
             y_padding = (y_max - y_min) * 0.1
             
             # Set X limits with padding
-            xmin, xmax = min(time_points), max(time_points)
+            xmin, xmax = self._get_time_range()
             x_padding = (xmax - xmin) * 0.05
             self.ax.set_xlim(xmin - x_padding, xmax + x_padding)
             
             # Set Y limits with padding
             self.ax.set_ylim(y_min - y_padding, y_max + y_padding)
-            
-            # Debug print the actual limits being set
-            print(f"Y-axis range:")
-            print(f"Raw range: [{y_min:.6f}, {y_max:.6f}]")
-            print(f"With padding: [{y_min - y_padding:.6f}, {y_max + y_padding:.6f}]")
         
         # Set labels and grid
         self.ax.set_xlabel("Time (ns)", fontsize=10, labelpad=8)
         self.ax.set_ylabel("Intensity (a.u.)", fontsize=10, labelpad=15)
         self.ax.grid(True)
         
-        # Place legend outside to the right with smaller font
+        # Place legend outside to the right with smaller font, in wavelength
+        # order regardless of which lines were reused
         self.ax.legend(
+            handles=lines,
             fontsize=7,  # Reduced font size
             bbox_to_anchor=(1.02, 1),
             loc='upper left',
@@ -140,7 +449,7 @@ class PlotWidget(QWidget):
         )
         
         # Use the same margins
-        self.figure.subplots_adjust(
+        self._set_margins(
             left=0.2,
             right=0.85,  # Increased right margin to accommodate legend
             top=0.85,
@@ -151,64 +460,91 @@ class PlotWidget(QWidget):
         if self.title:
             self.ax.set_title(self.title, pad=8)
             
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
     def plot_highlighted_wavelengths(
         self,
-        time_points: List[float],
-        data: dict,
-        highlighted_wavelengths: List[float],
+        time_points: Optional[List[float]] = None,
+        data: Optional[dict] = None,
+        highlighted_wavelengths: Optional[List[float]] = None,
         clear: bool = True
     ):
-        """Plot with multiple wavelengths highlighted."""
+        """
+        Plot with multiple wavelengths highlighted.
+        
+        Plots the ingested traces, or ingests time_points and a
+        {wavelength: values} data dictionary first when given.
+        """
+        self._ingest_dict(time_points, data)
+        times, matrix = self._display_traces()
+        highlighted_wavelengths = list(highlighted_wavelengths or [])
+        
         # Store current limits and title before clearing
         curr_xlim = self.ax.get_xlim()
         curr_ylim = self.ax.get_ylim()
         curr_title = self.ax.get_title()  # Store the current title
-        print(f"Stored limits before highlighting - Y: [{curr_ylim[0]:.6f}, {curr_ylim[1]:.6f}]")
         
+        reuse_grey = False
         if clear:
-            self.ax.clear()
-            
-        # Debug info
-        print(f"Highlighting {len(highlighted_wavelengths)} wavelengths")
-        print(f"Time points range: {min(time_points)} to {max(time_points)}")
+            reuse_grey = self._prepare_trace_lines('highlighted')
+        self._connect_xlim_callback()
             
-        # Plot all wavelengths in grey first
-        for wave, values in data.items():
-            if wave not in highlighted_wavelengths:
-                self.ax.plot(
-                    time_points,
-                    values,
-                    color='grey',
-                    alpha=0.3,
-                    zorder=1,  # Ensure grey lines are in the background
-                    label='Other wavelengths' if wave == list(data.keys())[0] else None  # Label only first grey line
-                )
+        # Rows of the highlighted wavelengths, found by hash lookup
+        colors = self.HIGHLIGHT_COLORS[
+            np.arange(len(highlighted_wavelengths)) % len(self.HIGHLIGHT_COLORS)
+        ]
+        shown = [
+            (wave, color, self._row_index[wave])
+            for wave, color in zip(highlighted_wavelengths, colors)
+            if wave in self._row_index
+        ]
+        is_highlighted = np.zeros(len(self._wavelengths), dtype=bool)
+        is_highlighted[[row for _, _, row in shown]] = True
         
-        # Plot highlighted wavelengths in different colors
-        if highlighted_wavelengths:
-            # Use a color cycle for multiple highlights
-            colors = plt.cm.tab10(np.linspace(0, 1, len(highlighted_wavelengths)))
-            for wave, color in zip(highlighted_wavelengths, colors):
-                if wave in data:
-                    values = data[wave]
-                    value_range = max(values) - min(values)
-                    print(f"Highlighted wavelength {wave}nm value range: {value_range}")
-                    
-                    self.ax.plot(
-                        time_points,
-                        values,
-                        color=color,
-                        label=f"{wave} nm",
-                        linewidth=2,
-                        zorder=2  # Ensure highlighted lines are in the foreground
-                    )
+        # Plot all other wavelengths in grey first, as one collection of
+        # (time, value) segments
+        legend_handles = []
+        grey_rows = np.flatnonzero(~is_highlighted)
+        segments = self._segments(times, matrix[grey_rows])
+        if reuse_grey:
+            grey_lines = self._grey_lines
+            grey_lines.set_segments(segments)
+        else:
+            grey_lines = LineCollection(
+                segments,
+                colors='grey',
+                alpha=0.3,
+                linewidths=matplotlib.rcParams['lines.linewidth'],
+                antialiaseds=self.BULK_LINE_ANTIALIASED,
+                zorder=1,  # Ensure grey lines are in the background
+                label='Other wavelengths'
+            )
+            self.ax.add_collection(grey_lines)
+            if clear:
+                self._grey_lines = grey_lines
+        self._trace_rows.append((grey_lines, grey_rows))
+        if len(grey_rows):
+            legend_handles.append(grey_lines)
+                
+        # Plot highlighted wavelengths in different colors, cycling through
+        # HIGHLIGHT_COLORS for multiple highlights
+        if shown:
+            rows = [row for _, _, row in shown]
+            # One call creates every highlighted line
+            lines = self.ax.plot(
+                times,
+                matrix[rows].T,
+                linewidth=2,
+                zorder=2  # Ensure highlighted lines are in the foreground
+            )
+            for line, (wave, color, row) in zip(lines, shown):
+                line.set(color=color, label=f"{wave} nm")
+                self._trace_rows.append((line, row))
+                legend_handles.append(line)
         
         # Restore the original limits
         self.ax.set_xlim(curr_xlim)
         self.ax.set_ylim(curr_ylim)
-        print(f"Restored limits after highlighting - Y: [{curr_ylim[0]:.6f}, {curr_ylim[1]:.6f}]")
         
         # Set labels and grid with increased padding
         self.ax.set_xlabel("Time (ns)", fontsize=10, labelpad=5)
@@ -217,6 +553,7 @@ class PlotWidget(QWidget):
         
         # Place legend outside to the right with smaller font, matching plot_all_wavelengths
         self.ax.legend(
+            handles=legend_handles,
             fontsize=7,  # Reduced font size
             bbox_to_anchor=(1.02, 1),
             loc='upper left',
@@ -224,7 +561,7 @@ class PlotWidget(QWidget):
         )
         
         # Use the same margins as plot_all_wavelengths
-        self.figure.subplots_adjust(
+        self._set_margins(
             left=0.2,
             right=0.85,  # Increased right margin to accommodate legend
             top=0.85,
@@ -237,38 +574,44 @@ class PlotWidget(QWidget):
         else:
             self.ax.set_title("absorption", pad=10, fontsize=12)  # Set default title if none exists
             
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
     def plot_average_intensity(
         self,
-        wavelengths: List[float],
-        averages: List[float],
+        wavelengths: np.ndarray,
+        averages: np.ndarray,
         time_range: Tuple[float, float],
         respect_limits: bool = False
     ):
         """Plot average intensity vs wavelength."""
+        # Arrays pass through without a copy; lists are still accepted
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        averages = np.asarray(averages, dtype=np.float64)
+        
         # Store current limits if needed
         if respect_limits:
             curr_xlim = self.ax.get_xlim()
             curr_ylim = self.ax.get_ylim()
-        self.ax.clear()
+        # Keep the line of a previous selection and only swap its data
+        if self._prepare_trace_lines('average'):
+            self._average_line.set_data(wavelengths, averages)
+        else:
+            self._average_line, = self.ax.plot(
+                wavelengths,
+                averages,
+                'bo-'
+            )
         if respect_limits:
             self.ax.set_xlim(curr_xlim)
             self.ax.set_ylim(curr_ylim)
-            
-        self.ax.plot(
-            wavelengths,
-            averages,
-            'bo-'
-        )
         
         # Only set limits if not respecting external limits
         if not respect_limits:
             # Calculate proper axis limits with padding
-            ymin, ymax = min(averages), max(averages)
+            ymin, ymax = averages.min(), averages.max()
             y_padding = (ymax - ymin) * 0.1
             
-            xmin, xmax = min(wavelengths), max(wavelengths)
+            xmin, xmax = wavelengths.min(), wavelengths.max()
             x_padding = (xmax - xmin) * 0.05
             
             self.ax.set_xlim(xmin - x_padding, xmax + x_padding)
@@ -284,14 +627,14 @@ class PlotWidget(QWidget):
         self.ax.grid(True)
         
         # Use updated margins
-        self.figure.subplots_adjust(
+        self._set_margins(
             left=0.2,
             right=0.95,
             top=0.85,
             bottom=0.12
         )
         
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
     def get_current_view(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
         """Get current axis limits."""
@@ -305,10 +648,38 @@ class PlotWidget(QWidget):
         xlim: Tuple[float, float],
         ylim: Tuple[float, float]
     ):
-        """Set axis limits."""
+        """
+        Set axis limits.
+        
+        Zoom sync calls this on every draw of the other plot, usually with
+        the limits already shown, so the redraw is skipped unless the view
+        actually changes. A changed view moves ticks and grid lines, which
+        needs a full (idle) redraw rather than blitting a cached background.
+        """
+        if (tuple(xlim), tuple(ylim)) == self.get_current_view():
+            return
         self.ax.set_xlim(xlim)
         self.ax.set_ylim(ylim)
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        
+    def snapshot(self) -> Figure:
+        """
+        Get an off-screen copy of the current figure.
+        
+        The copy has its own Agg canvas, so it can be rendered (e.g. saved
+        from a worker thread) without touching the live Qt canvas.
+        """
+        # Exports get the full-resolution traces, not the screen decimation
+        self._refresh_traces(decimate=False)
+        try:
+            figure = pickle.loads(pickle.dumps(self.figure))
+        finally:
+            self._refresh_traces()
+        FigureCanvasAgg(figure)
+        # Exports are rendered once at high resolution, so use full quality
+        for artist in figure.findobj(lambda artist: isinstance(artist, (Line2D, LineCollection))):
+            artist.set_antialiased(True)
+        return figure
         
     def is_sync_enabled(self) -> bool:
         """Check if zoom sync is enabled."""
@@ -318,4 +689,4 @@ class PlotWidget(QWidget):
         """Clear the plot."""
         self.ax.clear()
         self.ax.grid(True)
-        self.canvas.draw() 
\ No newline at end of file
+        self.canvas.draw_idle() 
\ No newline at end of file
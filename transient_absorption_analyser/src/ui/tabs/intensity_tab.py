@@ -3,7 +3,7 @@ Intensity tab implementation for average intensity plotting.
 """
 from typing import Optional, Dict, List, Tuple
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -22,13 +22,92 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QColorDialog
 )
-from PySide6.QtCore import Qt, Slot, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Slot, Signal, QTimer, QObject, QRunnable, QThreadPool, QLocale
+from PySide6.QtGui import QColor, QDoubleValidator
 from matplotlib.widgets import RectangleSelector, SpanSelector
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Rectangle
 
 from ..plot_widget import PlotWidget
 from ...core.data_processor import ProcessedData
+from ...core.kernels import NUMBA_MIN_SIZE, column_means
 
+class AverageSignals(QObject):
+    """Signals emitted by an AverageTask."""
+    
+    finished = Signal(object)  # Emits the finished AverageTask
+    error = Signal(object, str)  # Emits the failed AverageTask and message
+    
+    
+class AverageTask(QRunnable):
+    """Averages a time range of the sorted MA data on a thread pool thread."""
+    
+    def __init__(
+        self,
+        sorted_ma: np.ndarray,
+        sorted_wavelengths: np.ndarray,
+        rows: slice,
+        time_range: Tuple[float, float],
+        out: Optional[np.ndarray] = None
+    ):
+        super().__init__()
+        self.signals = AverageSignals()
+        self.sorted_ma = sorted_ma
+        self.sorted_wavelengths = sorted_wavelengths
+        self.rows = rows
+        self.time_range = time_range
+        self.out = out
+        self.wavelengths: Optional[np.ndarray] = None
+        self.averages: Optional[np.ndarray] = None
+        
+    @staticmethod
+    def average(
+        sorted_ma: np.ndarray,
+        sorted_wavelengths: np.ndarray,
+        rows: slice,
+        out: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Average the MA data of every wavelength over a range of time points.
+        
+        Args:
+            sorted_ma: MA data in ascending time and wavelength order
+            sorted_wavelengths: Wavelength of each column of sorted_ma
+            rows: Time rows to average, see IntensityTab._time_slice
+            out: Optional float64 buffer with one slot per column that the
+                NumPy reduction writes into instead of allocating
+            
+        Returns:
+            Wavelengths in ascending order and their averages, with NaN
+            averages left out
+        """
+        # A range outside the data or with min > max has no rows
+        if rows.stop <= rows.start:
+            return sorted_wavelengths[:0], np.empty(0)
+            
+        # One reduction over the (time, wavelength) block instead of a
+        # Python loop over columns; the slice is a view, not a copy
+        size = (rows.stop - rows.start) * sorted_ma.shape[1]
+        if column_means is not None and size >= NUMBA_MIN_SIZE:
+            averages = column_means(sorted_ma, rows.start, rows.stop)
+        else:
+            averages = sorted_ma[rows].mean(axis=0, dtype=np.float64, out=out)
+        # The selection copies the averages out, so out can be reused
+        valid = ~np.isnan(averages)
+        return sorted_wavelengths[valid], averages[valid]
+        
+    def run(self):
+        """Compute the averages."""
+        try:
+            self.wavelengths, self.averages = self.average(
+                self.sorted_ma, self.sorted_wavelengths, self.rows, self.out
+            )
+        except Exception as e:
+            self.signals.error.emit(self, str(e))
+        else:
+            self.signals.finished.emit(self)
+            
+            
 class TimeSpanEntry(QWidget):
     """Widget for a single time span entry."""
     
@@ -39,6 +118,9 @@ class TimeSpanEntry(QWidget):
         super().__init__()
         self.index = index
         self.current_color = initial_color
+        # Entered times, parsed as they are typed; None until valid
+        self.min_time: Optional[float] = None
+        self.max_time: Optional[float] = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -53,6 +135,14 @@ class TimeSpanEntry(QWidget):
         self.min_input.setFixedWidth(80)
         self.max_input.setFixedWidth(80)
         
+        # Only accept numbers float() can parse: '.' decimals, no grouping
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.OmitGroupSeparator | QLocale.RejectGroupSeparator)
+        validator = QDoubleValidator(self)
+        validator.setLocale(locale)
+        self.min_input.setValidator(validator)
+        self.max_input.setValidator(validator)
+        
         # Color picker button
         self.color_btn = QPushButton()
         self.color_btn.setFixedSize(30, 20)
@@ -74,6 +164,8 @@ class TimeSpanEntry(QWidget):
         layout.addStretch()
         
         # Connect signals
+        self.min_input.textChanged.connect(self.update_times)
+        self.max_input.textChanged.connect(self.update_times)
         self.color_btn.clicked.connect(self.show_color_dialog)
         self.apply_btn.clicked.connect(self.apply_changes)
         self.remove_btn.clicked.connect(lambda: self.removed.emit(self.index))
@@ -90,46 +182,71 @@ class TimeSpanEntry(QWidget):
             "border: 1px solid #999;"
         )
         
+    def update_times(self):
+        self.min_time = float(self.min_input.text()) if self.min_input.hasAcceptableInput() else None
+        self.max_time = float(self.max_input.text()) if self.max_input.hasAcceptableInput() else None
+        
     def apply_changes(self):
-        try:
-            min_time = float(self.min_input.text())
-            max_time = float(self.max_input.text())
-            self.updated.emit({
-                'index': self.index,
-                'min_time': min_time,
-                'max_time': max_time,
-                'color': self.current_color
-            })
-        except ValueError:
-            # Handle invalid input
-            pass
+        # Ignore incomplete input
+        if self.min_time is None or self.max_time is None:
+            return
+        self.updated.emit({
+            'index': self.index,
+            'min_time': self.min_time,
+            'max_time': self.max_time,
+            'color': self.current_color
+        })
 
 class IntensityTab(QWidget):
     """Tab for intensity visualization."""
     
     MAX_TIME_SPANS = 10
     
+    # Colors of new time spans, the matplotlib tab10 cycle
+    SPAN_COLORS = tuple(QColor.fromRgbF(*rgb) for rgb in matplotlib.colormaps['tab10'].colors)
+    
+    # Selection updates arriving within this many milliseconds are
+    # coalesced into one average computation and redraw
+    SELECTION_UPDATE_MS = 30
+    
+    # Number of time-range averages kept per data set; the oldest is
+    # dropped first
+    AVERAGE_CACHE_SIZE = 64
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.current_data: Optional[ProcessedData] = None
         self.selector = None
-        self._sync_in_progress = False
+        
         self.time_spans = []  # List to store time span data
         self.time_span_entries = []  # List to store TimeSpanEntry widgets
         
-        # Create plots first with sync_zoom=False
-        self.plot_a = PlotWidget(sync_zoom=False)
-        self.plot_c = PlotWidget(sync_zoom=False)
-        
-        # Configure plot sizes
-        self.plot_a.setFixedSize(600, 400)
-        self.plot_c.setFixedSize(600, 400)
-        
-        # Connect plot draw events for sync zoom
-        self.plot_a.canvas.mpl_connect('draw_event', self._on_plot_a_draw)
-        self.plot_c.canvas.mpl_connect('draw_event', self._on_plot_c_draw)
+        # Latest selected time range waiting for _flush_selection
+        self._pending_range: Optional[Tuple[float, float]] = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(self.SELECTION_UPDATE_MS)
+        self._selection_timer.timeout.connect(self._flush_selection)
+        # Selection average running on the thread pool, if any
+        self._average_task: Optional[AverageTask] = None
+        # Grey traces behind the time spans in Plot A, see update_plots()
+        self._span_background: Optional[LineCollection] = None
+        # Span rectangles in Plot A, moved and recoloured by update_plots()
+        self._span_patches: List[Rectangle] = []
+        
+        # MA data in ascending time and wavelength order, see update_data()
+        self._sorted_times = np.empty(0)
+        self._sorted_wavelengths = np.empty(0)
+        self._sorted_ma = np.empty((0, 0), dtype=np.float32)
+        # Output buffer reused by every selection average of the data set;
+        # only one AverageTask runs at a time
+        self._average_buffer = np.empty(0)
+        # Wavelengths and averages keyed by rows (start, stop); span edits
+        # and the release of a drag repeat ranges already averaged
+        self._average_cache: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
         
         self.setup_ui()
+        
         self._initialize_default_view()
         
     def setup_ui(self):
@@ -141,8 +258,8 @@ class IntensityTab(QWidget):
         left_layout = QVBoxLayout(left_container)
         left_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Plot A (top left)
-        self.plot_a = PlotWidget(sync_zoom=True)
+        # Plot A (top left); time and wavelength axes are not zoom-synced
+        self.plot_a = PlotWidget(sync_zoom=False)
         left_layout.addWidget(self.plot_a)
         
         # Time span settings section (bottom left)
@@ -184,7 +301,7 @@ class IntensityTab(QWidget):
         left_layout.addWidget(time_span_group)
         
         # Right side - Plot C only
-        self.plot_c = PlotWidget(sync_zoom=True)
+        self.plot_c = PlotWidget(sync_zoom=False)
         
         # Add containers to main layout
         main_layout.addWidget(left_container)
@@ -209,15 +326,30 @@ class IntensityTab(QWidget):
         self.plot_a.ax.set_xlabel("Time (ns)", fontsize=10, labelpad=5)
         self.plot_a.ax.set_ylabel("Intensity (a.u.)", fontsize=10, labelpad=5)
         self.plot_a.ax.set_title("absorption", pad=10, fontsize=12)  # Add default title
-        self.plot_a.canvas.draw()
+        self.plot_a.canvas.draw_idle()
         
         # Set default ranges for Plot C (average intensity plot)
         self.plot_c.ax.set_xlim(0, 1)
         self.plot_c.ax.set_ylim(-1, 1)
-        self.plot_c.canvas.draw()
+        self.plot_c.canvas.draw_idle()
         
     def _setup_selector(self):
         """Setup the span selector for manual time range selection."""
+        ax = self.plot_a.ax
+        if self.selector is not None and self.selector.ax is ax:
+            # Keep the selector and its event connections across data sets;
+            # redrawing Plot A removed its artists, so add them back
+            for artist in self.selector.artists:
+                if artist.axes is not ax:
+                    ax.add_artist(artist)
+            # Drop the previous data set's selection
+            self.selector.extents = (0, 0)
+            self.selector.set_visible(False)
+            self.selector.set_active(True)
+            return
+        if self.selector is not None:
+            self.selector.disconnect_events()
+            
         self.selector = SpanSelector(
             self.plot_a.ax,
             self._on_select,
@@ -225,7 +357,8 @@ class IntensityTab(QWidget):
             useblit=True,
             props=dict(alpha=0.2, facecolor='gray'),
             interactive=True,
-            drag_from_anywhere=True
+            drag_from_anywhere=True,
+            onmove_callback=self._on_select  # Update Plot C while dragging
         )
         
         # Add clear method to selector
@@ -235,50 +368,111 @@ class IntensityTab(QWidget):
                 self.selector.rect.remove()
             # Reset the selector's extents
             self.selector.extents = (0, 0)
-            self.plot_a.canvas.draw()
+            self.plot_a.canvas.draw_idle()
         self.selector.clear = clear
         
+    def _time_slice(self, time_min: float, time_max: float) -> slice:
+        """Rows of the sorted MA data with time_min <= time <= time_max."""
+        # Binary search on the sorted times instead of a full boolean mask
+        start = np.searchsorted(self._sorted_times, time_min, side='left')
+        stop = np.searchsorted(self._sorted_times, time_max, side='right')
+        return slice(int(start), int(stop))
+        
+    def _average_spectrum(self, rows: slice) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Average the MA data of every wavelength over a range of time points.
+        
+        Args:
+            rows: Time rows of the sorted MA data, see _time_slice
+            
+        Returns:
+            Wavelengths in ascending order and their averages, with NaN
+            averages left out
+        """
+        cached = self._cached_average(rows)
+        if cached is not None:
+            return cached
+        wavelengths, averages = AverageTask.average(
+            self._sorted_ma, self._sorted_wavelengths, rows
+        )
+        self._cache_average(rows, wavelengths, averages)
+        return wavelengths, averages
+        
+    def _cached_average(self, rows: slice) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Wavelengths and averages of rows if they were averaged before."""
+        return self._average_cache.get((rows.start, rows.stop))
+        
+    def _cache_average(self, rows: slice, wavelengths: np.ndarray, averages: np.ndarray):
+        """Remember the average of rows, dropping the oldest when full."""
+        if len(self._average_cache) >= self.AVERAGE_CACHE_SIZE:
+            del self._average_cache[next(iter(self._average_cache))]
+        self._average_cache[(rows.start, rows.stop)] = (wavelengths, averages)
+        
     def _on_select(self, xmin: float, xmax: float):
         """Handle time range selection."""
-        if self.current_data is None:
+        # Only the latest range of a burst of drag events gets computed
+        self._pending_range = (xmin, xmax)
+        self._selection_timer.start()
+        
+    def _flush_selection(self):
+        """Start averaging the latest selected time range in the background."""
+        # A running task picks up the latest range when it reports back
+        if (self.current_data is None or self._pending_range is None
+                or self._average_task is not None):
             return
+        xmin, xmax = self._pending_range
+        self._pending_range = None
             
-        try:
-            # Calculate average intensity for the selected time range using MA data
-            time_mask = (self.current_data.time_points >= xmin) & (self.current_data.time_points <= xmax)
+        # Calculate average intensity for the selected time range using MA data
+        rows = self._time_slice(xmin, xmax)
+        
+        if rows.start >= rows.stop:
+            print("No data points in selected range")
+            return
             
-            if not any(time_mask):
-                print("No data points in selected range")
-                return
-                
-            wavelengths = []
-            averages = []
+        cached = self._cached_average(rows)
+        if cached is not None:
+            self._plot_selection_average(*cached, (xmin, xmax))
+            return
             
-            for col in self.current_data.moving_average_data.columns[1:]:
-                try:
-                    wave = float(col)
-                    values = self.current_data.moving_average_data[col].values[time_mask]
-                    avg = np.mean(values)
-                    if not np.isnan(avg):
-                        wavelengths.append(wave)
-                        averages.append(avg)
-                except (ValueError, KeyError) as e:
-                    print(f"Error processing column {col}: {str(e)}")
-                    continue
-                    
-            if wavelengths and averages:
-                # Sort by wavelength
-                wavelengths = np.array(wavelengths)
-                averages = np.array(averages)
-                sort_idx = np.argsort(wavelengths)
-                wavelengths = wavelengths[sort_idx]
-                averages = averages[sort_idx]
-                
+        task = AverageTask(
+            self._sorted_ma,
+            self._sorted_wavelengths,
+            rows,
+            (xmin, xmax),
+            out=self._average_buffer
+        )
+        task.signals.finished.connect(self._on_average_finished)
+        task.signals.error.connect(self._on_average_error)
+        self._average_task = task  # Keep the task and its signals alive
+        QThreadPool.globalInstance().start(task)
+        
+    @Slot(object)
+    def _on_average_finished(self, task: AverageTask):
+        """Plot the averages of a finished selection task."""
+        if task is not self._average_task:
+            return  # Started for data that has since been replaced
+        self._average_task = None
+        self._cache_average(task.rows, task.wavelengths, task.averages)
+        self._plot_selection_average(task.wavelengths, task.averages, task.time_range)
+        
+        # The selection moved on while this task was running
+        self._flush_selection()
+        
+    def _plot_selection_average(
+        self,
+        wavelengths: np.ndarray,
+        averages: np.ndarray,
+        time_range: Tuple[float, float]
+    ):
+        """Plot the average spectrum of the selected time range in Plot C."""
+        try:
+            if len(wavelengths):
                 # Let plot_average_intensity handle its own scale calculation
                 self.plot_c.plot_average_intensity(
-                    wavelengths.tolist(),
-                    averages.tolist(),
-                    (xmin, xmax),
+                    wavelengths,
+                    averages,
+                    time_range,
                     respect_limits=False  # Let it calculate its own limits
                 )
             else:
@@ -288,6 +482,15 @@ class IntensityTab(QWidget):
             print(f"Error calculating average intensity: {str(e)}")
             import traceback
             traceback.print_exc()
+        
+    @Slot(object, str)
+    def _on_average_error(self, task: AverageTask, error_msg: str):
+        """Handle a failed selection task."""
+        if task is not self._average_task:
+            return  # Started for data that has since been replaced
+        print(f"Error calculating average intensity: {error_msg}")
+        self._average_task = None
+        self._flush_selection()
             
     def _on_apply_time_range(self):
         """Handle apply time range button click."""
@@ -309,10 +512,9 @@ class IntensityTab(QWidget):
                 return
                 
             # Calculate average intensity for the selected time range
-            time_points = np.array(self.current_data.time_points)
-            time_mask = (time_points >= time_min) & (time_points <= time_max)
+            rows = self._time_slice(time_min, time_max)
             
-            if not any(time_mask):
+            if rows.start >= rows.stop:
                 QMessageBox.warning(
                     self,
                     "Invalid Range",
@@ -320,30 +522,10 @@ class IntensityTab(QWidget):
                 )
                 return
                 
-            wavelengths = []
-            averages = []
-            
             # Calculate averages for each wavelength
-            for col in self.current_data.moving_average_data.columns[1:]:  # Skip time column
-                try:
-                    wave = float(col)
-                    values = self.current_data.moving_average_data[col].values[time_mask]
-                    avg = np.mean(values)
-                    if not np.isnan(avg):
-                        wavelengths.append(wave)
-                        averages.append(avg)
-                except (ValueError, KeyError) as e:
-                    print(f"Error processing column {col}: {str(e)}")
-                    continue
-                    
-            if wavelengths and averages:
-                # Sort by wavelength
-                wavelengths = np.array(wavelengths)
-                averages = np.array(averages)
-                sort_idx = np.argsort(wavelengths)
-                wavelengths = wavelengths[sort_idx]
-                averages = averages[sort_idx]
-                
+            wavelengths, averages = self._average_spectrum(rows)
+            
+            if len(wavelengths):
                 # Update both plots
                 # Update selector in Plot A without changing the view
                 if self.selector is not None:
@@ -351,18 +533,20 @@ class IntensityTab(QWidget):
                     current_xlim = self.plot_a.ax.get_xlim()
                     current_ylim = self.plot_a.ax.get_ylim()
                     
-                    # Update the selector
+                    # Update the selector; it redraws its own span
                     self.selector.extents = (time_min, time_max)
                     
-                    # Restore the original view
-                    self.plot_a.ax.set_xlim(current_xlim)
-                    self.plot_a.ax.set_ylim(current_ylim)
-                    self.plot_a.canvas.draw()
+                    # Restore the original view, redrawing only if it moved
+                    if (self.plot_a.ax.get_xlim() != current_xlim
+                            or self.plot_a.ax.get_ylim() != current_ylim):
+                        self.plot_a.ax.set_xlim(current_xlim)
+                        self.plot_a.ax.set_ylim(current_ylim)
+                        self.plot_a.canvas.draw_idle()
                 
                 # Let plot_average_intensity handle its own scale calculation
                 self.plot_c.plot_average_intensity(
-                    wavelengths.tolist(),
-                    averages.tolist(),
+                    wavelengths,
+                    averages,
                     (time_min, time_max),
                     respect_limits=False  # Let it calculate its own limits
                 )
@@ -386,72 +570,45 @@ class IntensityTab(QWidget):
                 f"Error applying time range: {str(e)}"
             ) 
 
-    def _on_plot_a_draw(self, event):
-        """Handle plot A draw event with debouncing."""
-        if not self._sync_in_progress and self.plot_a.is_sync_enabled():
-            self._sync_in_progress = True
-            try:
-                xlim, ylim = self.plot_a.get_current_view()
-                self.plot_c.set_view(xlim, ylim)
-            finally:
-                self._sync_in_progress = False
-                
-    def _on_plot_c_draw(self, event):
-        """Handle plot C draw event with debouncing."""
-        if not self._sync_in_progress and self.plot_a.is_sync_enabled():
-            self._sync_in_progress = True
-            try:
-                xlim, ylim = self.plot_c.get_current_view()
-                self.plot_a.set_view(xlim, ylim)
-            finally:
-                self._sync_in_progress = False 
-
     def update_data(self, data: ProcessedData):
         """Update displayed data."""
         self.current_data = data
+        # Drop selections made on the previous data
+        self._pending_range = None
+        self._average_task = None
+        self._average_cache = {}
         
         try:
-            # Get wavelength columns (excluding time column)
-            wavelength_columns = [col for col in data.moving_average_data.columns[1:]]  # Use MA data
-            print(f"[Tab 3] Found {len(wavelength_columns)} wavelength columns")
+            # MA data sorted by time and wavelength once per data set, so
+            # time range averages need no per-selection mask or sort
+            self._sorted_times, self._sorted_wavelengths, self._sorted_ma = (
+                data.sorted_moving_average
+            )
+            # A fresh buffer, as a task on the previous data may still run
+            self._average_buffer = np.empty(self._sorted_ma.shape[1])
             
-            # Create data dictionary for plotting
-            plot_data = {}
-            all_values = []  # Track all values for scale calculation
-            for col in wavelength_columns:
-                try:
-                    wave = float(col)
-                    values = data.moving_average_data[col].to_numpy()  # Use to_numpy() like Tab 2
-                    # Validate data
-                    if len(values) > 0 and not np.all(np.isnan(values)):
-                        plot_data[wave] = values
-                        all_values.extend(values)
-                        print(f"[Tab 3] Added wavelength {wave}nm with {len(values)} points")
-                        print(f"[Tab 3] Value range for {wave}nm: {min(values):.6f} to {max(values):.6f}")
-                except (ValueError, KeyError) as e:
-                    print(f"Error processing column {col}: {str(e)}")
-                    continue
+            # Wavelength traces as one (wavelength, time) array
+            wavelengths = data.wavelengths
+            traces = data.moving_average_array.T  # Use MA data
+            print(f"[Tab 3] Found {len(wavelengths)} wavelength columns")
             
-            if plot_data:
-                print(f"\n[Tab 3] Plotting {len(plot_data)} wavelengths")
+            # Skip traces without any valid value
+            valid = ~np.all(np.isnan(traces), axis=1)
+            if not valid.all():
+                wavelengths, traces = wavelengths[valid], traces[valid]
+                
+            if len(wavelengths):
+                print(f"\n[Tab 3] Plotting {len(wavelengths)} wavelengths")
                 print(f"[Tab 3] Time points: {len(data.time_points)} points")
-                print(f"[Tab 3] Time range: {min(data.time_points)} to {max(data.time_points)}")
+                print(f"[Tab 3] Time range: {data.time_points.min()} to {data.time_points.max()}")
                 
                 # Plot data in Plot A
+                self.plot_a.ingest(wavelengths, data.time_points, traces)
                 self.plot_a.plot_all_wavelengths(
-                    data.time_points,
-                    plot_data,
                     clear=True,
                     respect_limits=False  # Let it calculate its own limits
                 )
                 
-                # Check actual scale after plotting
-                actual_xlim = self.plot_a.ax.get_xlim()
-                actual_ylim = self.plot_a.ax.get_ylim()
-                print(f"[Tab 3] Actual plot scales after plotting:")
-                print(f"[Tab 3] X-axis: [{actual_xlim[0]:.6f}, {actual_xlim[1]:.6f}]")
-                print(f"[Tab 3] Y-axis: [{actual_ylim[0]:.6f}, {actual_ylim[1]:.6f}]")
-                
                 # Initialize Plot C with empty view
                 self.plot_c.clear()
                 self.plot_c.ax.set_xlabel("Wavelength (nm)")
@@ -461,13 +618,6 @@ class IntensityTab(QWidget):
                 
                 # Setup the selector for time range selection
                 self._setup_selector()
-                
-                # Check final scales after everything
-                final_xlim = self.plot_a.ax.get_xlim()
-                final_ylim = self.plot_a.ax.get_ylim()
-                print(f"\n[Tab 3] Final plot scales:")
-                print(f"[Tab 3] X-axis: [{final_xlim[0]:.6f}, {final_xlim[1]:.6f}]")
-                print(f"[Tab 3] Y-axis: [{final_ylim[0]:.6f}, {final_ylim[1]:.6f}]")
             else:
                 print("No valid wavelength data available for plotting")
                 for plot in [self.plot_a, self.plot_c]:
@@ -477,7 +627,7 @@ class IntensityTab(QWidget):
                         "No valid wavelength data available",
                         ha='center', va='center'
                     )
-                    plot.canvas.draw()
+                    plot.canvas.draw_idle()
                     
         except Exception as e:
             print(f"Error updating intensity plots: {str(e)}")
@@ -485,7 +635,7 @@ class IntensityTab(QWidget):
             traceback.print_exc()
             for plot in [self.plot_a, self.plot_c]:
                 plot.clear()
-                plot.canvas.draw()
+                plot.canvas.draw_idle()
 
     @Slot(str)
     def update_plot_titles(self, tag: str):
@@ -494,18 +644,17 @@ class IntensityTab(QWidget):
             title = f"absorption: {tag}"
             self.plot_a.ax.set_title(title, pad=10, fontsize=12)
             self.plot_c.ax.set_title(f"average intensity v.s. wavelength: {tag}\ntime span: {int(self.plot_c.time_range[0])} - {int(self.plot_c.time_range[1])} ns" if self.plot_c.time_range else title, pad=10, fontsize=12)
-            self.plot_a.canvas.draw()
-            self.plot_c.canvas.draw()
+            self.plot_a.canvas.draw_idle()
+            self.plot_c.canvas.draw_idle()
 
     def add_time_span(self):
         """Add a new time span entry."""
         if len(self.time_span_entries) >= self.MAX_TIME_SPANS:
             return
             
-        # Generate a new color from matplotlib color cycle
-        colors = plt.cm.tab10.colors
-        color_index = len(self.time_span_entries) % len(colors)
-        color = QColor.fromRgbF(*colors[color_index])
+        # Take the next color of the cycle; the entry gets its own copy
+        color_index = len(self.time_span_entries) % len(self.SPAN_COLORS)
+        color = QColor(self.SPAN_COLORS[color_index])
         
         # Create new entry
         entry = TimeSpanEntry(len(self.time_span_entries), color)
@@ -562,22 +711,9 @@ class IntensityTab(QWidget):
             
         # Reset and redraw plots with base data
         if self.current_data:
-            # Redraw Plot A with all wavelengths
-            wavelength_columns = [col for col in self.current_data.moving_average_data.columns[1:]]
-            plot_data = {}
-            for col in wavelength_columns:
-                try:
-                    wave = float(col)
-                    values = self.current_data.moving_average_data[col].to_numpy()
-                    if len(values) > 0 and not np.all(np.isnan(values)):
-                        plot_data[wave] = values
-                except (ValueError, KeyError):
-                    continue
-                    
-            if plot_data:
+            # Redraw Plot A with all wavelengths ingested in update_data
+            if self.plot_a.has_traces():
                 self.plot_a.plot_all_wavelengths(
-                    self.current_data.time_points,
-                    plot_data,
                     clear=True,
                     respect_limits=False
                 )
@@ -588,68 +724,63 @@ class IntensityTab(QWidget):
             self.plot_c.ax.set_ylabel("Average Intensity")
             self.plot_c.ax.set_title("Select time range in Plot A to calculate average")
             self.plot_c.ax.grid(True)
-            self.plot_c.canvas.draw()
+            self.plot_c.canvas.draw_idle()
 
     def update_plots(self):
         """Update both plots with current time spans."""
         if not self.current_data or not self.time_spans:
             return
             
-        # Clear plots
-        self.plot_a.ax.clear()
-        self.plot_c.ax.clear()
-        
-        # Get MA data
-        ma_data = self.current_data.moving_average_data
-        time_points = ma_data.iloc[:, 0].to_numpy()
-        
-        # Clean up column names by removing spaces
-        ma_data.columns = [col.strip() if isinstance(col, str) else col for col in ma_data.columns]
-        wavelengths = [float(col) for col in ma_data.columns[1:]]
-        
-        # Debug info
-        print(f"[Debug] Available columns in MA data (after cleanup): {ma_data.columns.tolist()}")
-        print(f"[Debug] Number of time spans: {len(self.time_spans)}")
-        
-        # Plot A: Show all data with colored spans
-        for col in ma_data.columns[1:]:  # Skip time column
-            self.plot_a.ax.plot(time_points, ma_data[col], color='gray', alpha=0.5)
+        # Clear plots; Plot A keeps the grey traces and span rectangles of
+        # a previous update
+        background = self._span_background
+        reuse_background = background is not None and background.axes is self.plot_a.ax
+        if reuse_background:
+            self._span_patches = [
+                patch for patch in self._span_patches if patch.axes is self.plot_a.ax
+            ]
+            self.plot_a.remove_artists(keep=[background, *self._span_patches])
+        else:
+            self.plot_a.ax.clear()
+            self._span_patches = []
+        self.plot_c.remove_artists()
+        
+        # Plot A: Show all data with colored spans, the traces ingested in
+        # update_data drawn as one collection
+        if not reuse_background:
+            self._span_background = self.plot_a.add_trace_collection(
+                colors='gray', alpha=0.5,
+                antialiaseds=PlotWidget.BULK_LINE_ANTIALIASED
+            )
             
         # Add colored spans and plot averaged data
-        for span in self.time_spans:
-            if span is None:
-                continue
-                
-            print(f"[Debug] Processing time span: {span['min_time']} - {span['max_time']}")
-            
-            # Add span to Plot A
+        active_spans = [span for span in self.time_spans if span is not None]
+        for index, span in enumerate(active_spans):
+            # Add span to Plot A, moving a rectangle of the previous update
+            # when there is one
             color = span['color'].getRgbF()[:3]  # Convert QColor to RGB
-            self.plot_a.ax.axvspan(
-                span['min_time'],
-                span['max_time'],
-                color=color,
-                alpha=0.2
-            )
-            
-            # Calculate and plot averaged data
-            mask = (time_points >= span['min_time']) & (time_points <= span['max_time'])
-            averages = []
+            if index < len(self._span_patches):
+                patch = self._span_patches[index]
+                patch.set_x(span['min_time'])
+                patch.set_width(span['max_time'] - span['min_time'])
+                patch.set_color(color)
+                patch.set_visible(True)
+            else:
+                self._span_patches.append(self.plot_a.ax.axvspan(
+                    span['min_time'],
+                    span['max_time'],
+                    color=color,
+                    alpha=0.2
+                ))
             
-            for wave in wavelengths:
-                # Convert wavelength to match column format
-                col_name = str(int(wave))  # Convert to integer string format
-                try:
-                    values = ma_data[col_name][mask]
-                    avg = np.mean(values)
-                    averages.append(avg)
-                    print(f"[Debug] Calculated average for wavelength {col_name}: {avg}")
-                except KeyError as e:
-                    print(f"[Debug] Error accessing wavelength {col_name}: {str(e)}")
-                    print(f"[Debug] Available columns: {ma_data.columns.tolist()}")
-                    continue
+            # Calculate and plot averaged data, using the wavelengths parsed
+            # and sorted in update_data
+            wavelengths, averages = self._average_spectrum(
+                self._time_slice(span['min_time'], span['max_time'])
+            )
                 
             # Only plot if we have averages
-            if averages:
+            if len(averages):
                 self.plot_c.ax.plot(
                     wavelengths,
                     averages,
@@ -664,6 +795,15 @@ class IntensityTab(QWidget):
             else:
                 print("[Debug] No averages calculated for this time span")
             
+        # Hide the rectangles of removed spans
+        for patch in self._span_patches[len(active_spans):]:
+            patch.set_visible(False)
+            
+        # Fit both views to the new traces, spans and averages; a drag
+        # selection left explicit limits on Plot C
+        self.plot_a.autoscale()
+        self.plot_c.autoscale()
+            
         # Update plot settings
         self.plot_a.ax.set_xlabel("Time (ns)")
         self.plot_a.ax.set_ylabel("Intensity")
@@ -684,5 +824,5 @@ class IntensityTab(QWidget):
             self.plot_c.ax.set_title("Select time range in Plot A to calculate average")
         
         # Redraw
-        self.plot_a.canvas.draw()
-        self.plot_c.canvas.draw() 
\ No newline at end of file
+        self.plot_a.canvas.draw_idle()
+        self.plot_c.canvas.draw_idle() 
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Spectrum tab implementation for wavelength plotting.
 """
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -18,7 +18,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QApplication
 )
-from PySide6.QtCore import Qt, Slot, QSize, Signal
+from PySide6.QtCore import Qt, Slot, QSize, Signal, QTimer
 import numpy as np
 
 from ..plot_widget import PlotWidget
@@ -30,11 +30,23 @@ class SpectrumTab(QWidget):
     # Add signal for tag changes
     tag_changed = Signal(str)  # Add this near the top of the class
     
+    # Plot draws within this many milliseconds are coalesced into one zoom
+    # sync of the other plot
+    SYNC_UPDATE_MS = 30
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.current_data: Optional[ProcessedData] = None
         self.wavelength_buttons = []
-        self._sync_in_progress = False
+        
+        # Plot whose view is waiting for _sync_views, and the last view
+        # synced; the peer's own draw then finds nothing new to sync
+        self._sync_source: Optional[PlotWidget] = None
+        self._synced_view: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(self.SYNC_UPDATE_MS)
+        self._sync_timer.timeout.connect(self._sync_views)
         
         # Create the plots first
         self.plot_a = PlotWidget()
@@ -177,18 +189,15 @@ class SpectrumTab(QWidget):
         try:
             # Get time range from the data
             time_points = data.time_points
-            x_min, x_max = min(time_points), max(time_points)
+            x_min, x_max = time_points.min(), time_points.max()
             x_padding = (x_max - x_min) * 0.05  # 5% padding
             
-            # Get value range from the processed data (moving_average_data contains smoothed signal-reference)
-            all_values = []
-            for col in data.moving_average_data.columns[1:]:  # Skip time column
-                values = data.moving_average_data[col].values
-                all_values.extend(values)
+            # Get value range from the processed data (moving_average_data contains smoothed signal-reference),
+            # using its cached (time, wavelength) array rather than collecting the columns
+            y_values = data.moving_average_array
                 
-            if all_values:
+            if y_values.size:
                 # Calculate robust y-range using percentiles to avoid outliers
-                y_values = np.array(all_values)
                 y_min, y_max = np.percentile(y_values, [1, 99])  # Use 1st and 99th percentiles
                 y_padding = (y_max - y_min) * 0.1  # 10% padding
                 
@@ -196,7 +205,7 @@ class SpectrumTab(QWidget):
                 for plot in [self.plot_a, self.plot_b]:
                     plot.ax.set_xlim(x_min - x_padding, x_max + x_padding)
                     plot.ax.set_ylim(y_min - y_padding, y_max + y_padding)
-                    plot.canvas.draw()
+                    plot.canvas.draw_idle()
                     
                 print(f"Updated plot scales - X: [{x_min - x_padding:.2f}, {x_max + x_padding:.2f}], "
                       f"Y: [{y_min - y_padding:.6f}, {y_max + y_padding:.6f}]")
@@ -210,36 +219,27 @@ class SpectrumTab(QWidget):
         self.current_data = data
         
         try:
-            # Get wavelength columns (excluding time column)
-            wavelength_columns = [col for col in data.moving_average_data.columns[1:]]  # Use MA data
-            print(f"[Tab 2] Found {len(wavelength_columns)} wavelength columns")
+            # Wavelength traces as one (wavelength, time) array
+            wavelengths = data.wavelengths
+            traces = data.moving_average_array.T  # Use MA data
+            print(f"[Tab 2] Found {len(wavelengths)} wavelength columns")
             
-            # Create data dictionary for plotting
-            plot_data = {}
-            all_values = []  # Track all values for scale calculation
-            for col in wavelength_columns:
-                try:
-                    wave = float(col)
-                    values = data.moving_average_data[col].to_numpy()  # Use to_numpy() like Tab 2
-                    # Validate data
-                    if len(values) > 0 and not np.all(np.isnan(values)):
-                        plot_data[wave] = values
-                        all_values.extend(values)
-                        print(f"[Tab 2] Added wavelength {wave}nm with {len(values)} points")
-                        print(f"[Tab 2] Value range for {wave}nm: {min(values):.6f} to {max(values):.6f}")
-                except (ValueError, KeyError) as e:
-                    print(f"Error processing column {col}: {str(e)}")
-                    continue
-            
-            if plot_data:
-                print(f"\n[Tab 2] Plotting {len(plot_data)} wavelengths")
+            # Skip traces without any valid value
+            valid = ~np.all(np.isnan(traces), axis=1)
+            if not valid.all():
+                wavelengths, traces = wavelengths[valid], traces[valid]
+                
+            if len(wavelengths):
+                print(f"\n[Tab 2] Plotting {len(wavelengths)} wavelengths")
                 print(f"[Tab 2] Time points: {len(data.time_points)} points")
-                print(f"[Tab 2] Time range: {min(data.time_points)} to {max(data.time_points)}")
+                print(f"[Tab 2] Time range: {data.time_points.min()} to {data.time_points.max()}")
                 
+                # Both plots draw the same traces
+                for plot in [self.plot_a, self.plot_b]:
+                    plot.ingest(wavelengths, data.time_points, traces)
+                    
                 # Plot data in Plot A
                 self.plot_a.plot_all_wavelengths(
-                    data.time_points,
-                    plot_data,
                     clear=True,
                     respect_limits=False
                 )
@@ -248,19 +248,12 @@ class SpectrumTab(QWidget):
                 plot_a_xlim = self.plot_a.ax.get_xlim()
                 plot_a_ylim = self.plot_a.ax.get_ylim()
                 
-                # Check actual scale after plotting
-                print(f"[Tab 2] Actual plot scales after plotting:")
-                print(f"[Tab 2] X-axis: [{plot_a_xlim[0]:.6f}, {plot_a_xlim[1]:.6f}]")
-                print(f"[Tab 2] Y-axis: [{plot_a_ylim[0]:.6f}, {plot_a_ylim[1]:.6f}]")
-                
                 # Update wavelength selection
-                self.update_wavelength_buttons(sorted(plot_data.keys()))
+                self.update_wavelength_buttons(wavelengths.tolist())
                 
                 # Show all curves in grey initially in Plot B, using the same limits as Plot A
                 self.plot_b.plot_highlighted_wavelengths(
-                    data.time_points,
-                    plot_data,
-                    []  # No wavelengths highlighted initially
+                    highlighted_wavelengths=[]  # No wavelengths highlighted initially
                 )
                 
                 # Force both plots to use the same limits
@@ -270,14 +263,7 @@ class SpectrumTab(QWidget):
                     # Set default title if none exists
                     if not plot.ax.get_title():
                         plot.ax.set_title("absorption", pad=10, fontsize=12)
-                    plot.canvas.draw()
-                
-                # Check final scales
-                final_xlim = self.plot_a.ax.get_xlim()
-                final_ylim = self.plot_a.ax.get_ylim()
-                print(f"\n[Tab 2] Final plot scales:")
-                print(f"[Tab 2] X-axis: [{final_xlim[0]:.6f}, {final_xlim[1]:.6f}]")
-                print(f"[Tab 2] Y-axis: [{final_ylim[0]:.6f}, {final_ylim[1]:.6f}]")
+                    plot.canvas.draw_idle()
             else:
                 print("No valid wavelength data available for plotting")
                 self.plot_a.clear()
@@ -289,7 +275,7 @@ class SpectrumTab(QWidget):
                         ha='center', va='center'
                     )
                     plot.ax.set_title("absorption", pad=10, fontsize=12)  # Set title even when no data
-                    plot.canvas.draw()
+                    plot.canvas.draw_idle()
             
         except Exception as e:
             print(f"Error updating spectrum plots: {str(e)}")
@@ -330,24 +316,10 @@ class SpectrumTab(QWidget):
                 if button.isChecked():
                     selected_wavelengths.append(button.property('wavelength'))
             
-            # Get wavelength columns (excluding time column)
-            wavelength_columns = [col for col in self.current_data.moving_average_data.columns[1:]]  # Use MA data
-            
-            # Create data dictionary for plotting
-            plot_data = {}
-            for col in wavelength_columns:
-                try:
-                    wave = float(col)
-                    plot_data[wave] = self.current_data.moving_average_data[col].values  # Use MA data
-                except (ValueError, KeyError):
-                    continue
-            
-            # Update Plot B
-            if plot_data:
+            # Update Plot B from the traces ingested in update_data
+            if self.plot_b.has_traces():
                 self.plot_b.plot_highlighted_wavelengths(
-                    self.current_data.time_points,
-                    plot_data,
-                    selected_wavelengths
+                    highlighted_wavelengths=selected_wavelengths
                 )
                 
                 # Sync zoom if enabled
@@ -374,23 +346,27 @@ class SpectrumTab(QWidget):
 
     def _on_plot_a_draw(self, event):
         """Handle plot A draw event with debouncing."""
-        if not self._sync_in_progress and self.plot_a.is_sync_enabled():
-            self._sync_in_progress = True
-            try:
-                xlim, ylim = self.plot_a.get_current_view()
-                self.plot_b.set_view(xlim, ylim)
-            finally:
-                self._sync_in_progress = False
-                
+        if self.plot_a.is_sync_enabled():
+            self._sync_source = self.plot_a
+            self._sync_timer.start()
+            
     def _on_plot_b_draw(self, event):
         """Handle plot B draw event with debouncing."""
-        if not self._sync_in_progress and self.plot_a.is_sync_enabled():
-            self._sync_in_progress = True
-            try:
-                xlim, ylim = self.plot_b.get_current_view()
-                self.plot_a.set_view(xlim, ylim)
-            finally:
-                self._sync_in_progress = False
+        if self.plot_a.is_sync_enabled():
+            self._sync_source = self.plot_b
+            self._sync_timer.start()
+            
+    def _sync_views(self):
+        """Copy the view of the last drawn plot to the other plot."""
+        source, self._sync_source = self._sync_source, None
+        if source is None:
+            return
+        view = source.get_current_view()
+        if view == self._synced_view:
+            return
+        self._synced_view = view
+        target = self.plot_b if source is self.plot_a else self.plot_a
+        target.set_view(*view)
                 
     def _on_apply_tag(self):
         """Handle apply tag button click."""
@@ -400,8 +376,8 @@ class SpectrumTab(QWidget):
             title = f"absorption: {tag}"
             self.plot_a.ax.set_title(title, pad=10, fontsize=12)
             self.plot_b.ax.set_title(title, pad=10, fontsize=12)
-            self.plot_a.canvas.draw()
-            self.plot_b.canvas.draw()
+            self.plot_a.canvas.draw_idle()
+            self.plot_b.canvas.draw_idle()
             
             # Emit signal with new tag
             self.tag_changed.emit(tag) 
\ No newline at end of file